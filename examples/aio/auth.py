@@ -11,8 +11,8 @@ async def get_api_key_info(client: AsyncClient) -> None:
 
 
 async def main() -> None:
-    client = AsyncClient()
-    await get_api_key_info(client)
+    async with AsyncClient() as client:
+        await get_api_key_info(client)
 
 
 if __name__ == "__main__":
@@ -1,90 +1,127 @@
 import asyncio
 
+import httpx
+
 from xai_sdk import AsyncClient
 from xai_sdk.chat import image, user
 
+# Polling starts short so small batches are picked up quickly, and backs off while no progress is made.
+MIN_POLL_INTERVAL_SECONDS = 0.25
+MAX_POLL_INTERVAL_SECONDS = 5.0
+POLL_BACKOFF_FACTOR = 1.25
+
+SEPARATOR = "---" * 20
+SHORT_SEPARATOR = "---" * 10
+
+# Number of requests sent per `batch.add` call. Chunks are added concurrently.
+ADD_CHUNK_SIZE = 32
+
+
+async def validate_image_urls(http_client: httpx.AsyncClient, image_urls: list[str]) -> list[str]:
+    """Checks all image URLs concurrently and returns the ones that are reachable."""
+    responses = await asyncio.gather(*(http_client.head(url) for url in image_urls), return_exceptions=True)
+    valid_urls = []
+    for url, response in zip(image_urls, responses, strict=True):
+        if isinstance(response, httpx.Response) and response.is_success:
+            valid_urls.append(url)
+        else:
+            print(f"Skipping unreachable image: {url}")
+    return valid_urls
+
 
 async def main():
-    client = AsyncClient()
-
-    # Create a new batch
-    batch = await client.batch.create(batch_name="my_batch")
-    print("Created new batch")
-    print("---" * 20)
-    print(batch)
-
-    # Compose the chat requests
-    image_urls = [
-        "https://images.unsplash.com/photo-1761301006532-fa8143787a88?ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&q=80&w=987",
-        "https://images.unsplash.com/photo-1761562964782-4c971df72d29?ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&q=80&w=987",
-        "https://images.unsplash.com/photo-1521747116042-5a810fda9664?ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&q=80&w=1170",
-    ]
-
-    batch_requests = []
-
-    for index, image_url in enumerate(image_urls):
-        chat = client.chat.create(
-            model="grok-4.20",
-            max_tokens=1000,
-            temperature=0.7,
-            batch_request_id=f"req_{index}",
-        )
-        chat.append(
-            user(
-                "Please analyze this image and return JSON with the following fields: "
-                "'city', 'country', 'attraction_name'",
-                image(image_url, detail="high"),
+    async with AsyncClient() as client:
+        # Create a new batch
+        batch = await client.batch.create(batch_name="my_batch")
+        print("Created new batch")
+        print(SEPARATOR)
+        print(batch)
+
+        # Compose the chat requests
+        image_urls = [
+            "https://images.unsplash.com/photo-1761301006532-fa8143787a88?ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&q=80&w=987",
+            "https://images.unsplash.com/photo-1761562964782-4c971df72d29?ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&q=80&w=987",
+            "https://images.unsplash.com/photo-1521747116042-5a810fda9664?ixlib=rb-4.1.0&ixid=M3wxMjA3fDB8MHxwaG90by1wYWdlfHx8fGVufDB8fHx8fA%3D%3D&auto=format&fit=crop&q=80&w=1170",
+        ]
+
+        # Validate the image URLs before submitting the batch. A single pooled HTTP client is shared by all
+        # requests so connections to the same host are reused.
+        async with httpx.AsyncClient(
+            follow_redirects=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        ) as http_client:
+            image_urls = await validate_image_urls(http_client, image_urls)
+
+        batch_requests = []
+
+        for index, image_url in enumerate(image_urls):
+            chat = client.chat.create(
+                model="grok-4.20",
+                max_tokens=1000,
+                temperature=0.7,
+                batch_request_id=f"req_{index}",
+            )
+            chat.append(
+                user(
+                    "Please analyze this image and return JSON with the following fields: "
+                    "'city', 'country', 'attraction_name'",
+                    image(image_url, detail="high"),
+                )
+            )
+            batch_requests.append(chat)
+
+        # Add requests to the batch in chunks, so that large batches are not sent as a single huge RPC
+        await asyncio.gather(
+            *(
+                client.batch.add(batch_id=batch.batch_id, batch_requests=batch_requests[i : i + ADD_CHUNK_SIZE])
+                for i in range(0, len(batch_requests), ADD_CHUNK_SIZE)
             )
         )
-        batch_requests.append(chat)
-
-    # Add requests to the batch
-    await client.batch.add(batch_id=batch.batch_id, batch_requests=batch_requests)
-
-    # Wait for batch to complete by polling for completion
-    print("Waiting for batch to complete...")
-    while True:
-        batch = await client.batch.get(batch_id=batch.batch_id)
-        print(f"Progress: {batch.state.num_success + batch.state.num_error}/{batch.state.num_requests}")
-        if batch.state.num_pending == 0:
-            break
-        await asyncio.sleep(3)
-
-    # Display final batch status
-    print("Final batch status")
-    print("---" * 10)
-    print(batch)
-
-    # Display cost (ticks are in units of 1e-10 USD)
-    print(f"Total cost: ${batch.cost_breakdown.total_cost_usd_ticks / 1e10:.4f}")
-
-    # List the individual requests of a batch
-    metadata = await client.batch.list_batch_requests(batch_id=batch.batch_id)
-    print("Listing metadata of individual requests in batch")
-    print("---" * 20)
-    print(metadata)
-
-    # List the results of a batch
-    batch_results = await client.batch.list_batch_results(batch_id=batch.batch_id)
-    # Filter the results into succeeded and failed
-    succeeded = batch_results.succeeded
-    failed = batch_results.failed
-    print("Listing batch results")
-    print("---" * 20)
-
-    print("Succeeded results:")
-    print("---" * 20)
-    for result in succeeded:
-        print(f"Batch request ID: {result.batch_request_id}")
-        print(f"Response Content: {result.response.content}")
-
-    if len(failed) > 0:
-        print("Failed results:")
-        print("---" * 20)
-
-        for result in failed:
-            print(f"Batch request ID: {result.batch_request_id}")
-            print(f"Error: {result.error_message}")
+
+        # Wait for batch to complete by polling for completion
+        print("Waiting for batch to complete...")
+        interval = MIN_POLL_INTERVAL_SECONDS
+        num_completed = 0
+        while True:
+            batch = await client.batch.get(batch_id=batch.batch_id)
+            # Only report the progress counters while polling; the full batch is printed once it has completed.
+            state = batch.state
+            completed = state.num_success + state.num_error
+            print(f"Progress: {completed}/{state.num_requests}")
+            if state.num_pending == 0:
+                break
+            if completed > num_completed:
+                # Progress was made since the last poll, check back soon.
+                num_completed = completed
+                interval = MIN_POLL_INTERVAL_SECONDS
+            else:
+                interval = min(interval * POLL_BACKOFF_FACTOR, MAX_POLL_INTERVAL_SECONDS)
+            await asyncio.sleep(interval)
+
+        # Display final batch status
+        print("Final batch status")
+        print(SHORT_SEPARATOR)
+        print(batch)
+
+        # Display cost (ticks are in units of 1e-10 USD)
+        print(f"Total cost: ${batch.cost_breakdown.total_cost_usd_ticks / 1e10:.4f}")
+
+        # List the individual requests of a batch
+        metadata = await client.batch.list_batch_requests(batch_id=batch.batch_id)
+        print("Listing metadata of individual requests in batch")
+        print(SEPARATOR)
+        print(metadata)
+
+        # Stream the results of a batch. Results are printed as soon as their page has been fetched.
+        print("Listing batch results")
+        print(SEPARATOR)
+        async for result in client.batch.stream_batch_results(batch_id=batch.batch_id):
+            if result.is_success:
+                outcome = f"Response Content: {result.response.content}"
+            else:
+                outcome = f"Error: {result.error_message}"
+            print(f"Batch request ID: {result.batch_request_id}\n{outcome}")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,8 @@
 import asyncio
+import math
+import shutil
+import sys
+import time
 from typing import Sequence
 
 from absl import app, flags
@@ -9,12 +13,18 @@ from xai_sdk.chat import assistant, system, user
 STREAM = flags.DEFINE_bool("stream", False, "Whether streaming is enabled.")
 N = flags.DEFINE_integer("n", 1, "Number of answers to generate.")
 
+# Minimum time between two redraws of the batch of streamed responses.
+REDRAW_INTERVAL_SECONDS = 0.05
+
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
 
 async def basic_chat(chat: xai_sdk.aio.chat.Chat):
     """Multi-turn chat between a user and an assistant."""
     total_cost_usd = 0.0
     while True:
-        prompt = input("You: ")
+        prompt = await asyncio.to_thread(input, "You: ")
         if prompt.lower() == "exit":
             break
 
@@ -36,7 +46,7 @@ async def chat_with_streaming(chat: xai_sdk.aio.chat.Chat):
     """Multi-turn chat between a user and an assistant with streaming."""
     total_cost_usd = 0.0
     while True:
-        prompt = input("You: ")
+        prompt = await asyncio.to_thread(input, "You: ")
         if prompt.lower() == "exit":
             break
 
@@ -48,9 +58,14 @@ async def chat_with_streaming(chat: xai_sdk.aio.chat.Chat):
         # Stream a response from the assistant.
         stream = chat.stream()
         last_response = None
+        last_flush = time.monotonic()
         async for response, chunk in stream:
-            print(chunk.content, end="", flush=True)
+            sys.stdout.write(chunk.content)
             last_response = response
+            if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+                sys.stdout.flush()
+                last_flush = time.monotonic()
+        sys.stdout.flush()
         print()
         assert last_response is not None
         chat.append(last_response)
@@ -64,26 +79,47 @@ async def chat_with_streaming(chat: xai_sdk.aio.chat.Chat):
 async def batch_chat(chat: xai_sdk.aio.chat.Chat):
     """Multi-turn chat between a user and an assistant with batch sampling."""
     while True:
-        prompt = input("You: ")
+        prompt = await asyncio.to_thread(input, "You: ")
         if prompt.lower() == "exit":
             break
 
         # Append a user turn to the conversation history.
         chat.append(user(prompt))
 
-        # Sample multiple responses concurrently from the assistant.
-        responses = await chat.sample_batch(N.value)
-        for index, response in enumerate(responses):
-            print(f"Grok (response {index + 1}): {response.content}")
+        # Sample multiple responses concurrently from the assistant. The responses are streamed so that each one can
+        # be printed as soon as it is finished, instead of all of them waiting for the slowest one.
+        pending = set(range(N.value))
+        responses = None
+        async for responses, _ in chat.stream_batch(N.value):
+            for index in sorted(pending):
+                if responses[index].finish_reason != "REASON_INVALID":
+                    print(f"Grok (response {index + 1}): {responses[index].content}")
+                    pending.discard(index)
+        assert responses is not None
+        for index in sorted(pending):
+            print(f"Grok (response {index + 1}): {responses[index].content}")
 
         # Only add the first response to the history.
         chat.append(responses[0])
 
 
+def _redraw_responses(previous: str, responses: Sequence[xai_sdk.chat.Response]) -> str:
+    """Writes the current state of all responses and returns the rendered text."""
+    rendered = "".join(f"Grok (response {index + 1}): {response.content}\n" for index, response in enumerate(responses))
+    if previous and sys.stdout.isatty():
+        # Move the cursor back to the start of the previous render and clear it, so the output is updated in place.
+        # Lines wider than the terminal are soft-wrapped onto several rows, which all have to be moved over.
+        columns = shutil.get_terminal_size().columns
+        num_rows = sum(max(1, math.ceil(len(line) / columns)) for line in previous.split("\n")[:-1])
+        print(f"\x1b[{num_rows}F\x1b[J", end="")
+    print(rendered, end="", flush=True)
+    return rendered
+
+
 async def batch_chat_with_streaming(chat: xai_sdk.aio.chat.Chat):
     """Multi-turn chat between a user and an assistant with batch sampling and streaming."""
     while True:
-        prompt = input("You: ")
+        prompt = await asyncio.to_thread(input, "You: ")
         if prompt.lower() == "exit":
             break
 
@@ -92,9 +128,16 @@ async def batch_chat_with_streaming(chat: xai_sdk.aio.chat.Chat):
 
         batch_stream = chat.stream_batch(N.value)
         responses = None
+        loop = asyncio.get_running_loop()
+        rendered = ""
+        last_render = 0.0
         async for responses, _ in batch_stream:
-            for index, response in enumerate(responses):
-                print(f"Grok (response {index + 1}): {response.content}")
+            # Redraw at most every `REDRAW_INTERVAL_SECONDS` rather than on every streamed chunk.
+            if loop.time() - last_render >= REDRAW_INTERVAL_SECONDS:
+                rendered = _redraw_responses(rendered, responses)
+                last_render = loop.time()
+        if responses is not None:
+            _redraw_responses(rendered, responses)
 
         # Only add the first response.
         assert responses is not None
@@ -105,26 +148,25 @@ async def main(argv: Sequence[str]) -> None:
     if len(argv) > 1:
         raise app.UsageError("Unexpected command line arguments.")
 
-    client = xai_sdk.AsyncClient()
-
-    chat = client.chat.create(
-        model="grok-4.20-non-reasoning",
-        messages=[
-            system("You talk like a pirate."),
-            user("How are you?"),
-            assistant("Actually not so well..."),
-        ],
-    )
-
-    match (N.value, STREAM.value):
-        case (1, False):
-            await basic_chat(chat)
-        case (_, False):
-            await batch_chat(chat)
-        case (1, True):
-            await chat_with_streaming(chat)
-        case (_, True):
-            await batch_chat_with_streaming(chat)
+    async with xai_sdk.AsyncClient() as client:
+        chat = client.chat.create(
+            model="grok-4.20-non-reasoning",
+            messages=[
+                system("You talk like a pirate."),
+                user("How are you?"),
+                assistant("Actually not so well..."),
+            ],
+        )
+
+        match (N.value, STREAM.value):
+            case (1, False):
+                await basic_chat(chat)
+            case (_, False):
+                await batch_chat(chat)
+            case (1, True):
+                await chat_with_streaming(chat)
+            case (_, True):
+                await batch_chat_with_streaming(chat)
 
 
 if __name__ == "__main__":
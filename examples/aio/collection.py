@@ -74,21 +74,20 @@ async def create_collection_with_bytes_chunking(client: xai_sdk.AsyncClient):
 
 
 async def list_collections(client: xai_sdk.AsyncClient):
-    print("\n=== List Collections ===")
-
     response = await client.collections.list(
         limit=10,
         order="asc",
         sort_by="name",
     )
 
-    print(f"Found {len(response.collections)} collections (sorted by name):")
+    lines = ["\n=== List Collections ===", f"Found {len(response.collections)} collections (sorted by name):"]
     for collection in response.collections:
-        print(f"  - {collection.collection_name} (ID: {collection.collection_id})")
-        print(f"    Documents: {collection.documents_count}")
+        lines.append(f"  - {collection.collection_name} (ID: {collection.collection_id})")
+        lines.append(f"    Documents: {collection.documents_count}")
 
     if response.pagination_token:
-        print("\nPagination token available for next page")
+        lines.append("\nPagination token available for next page")
+    print("\n".join(lines))
 
 
 async def list_collections_with_filter(client: xai_sdk.AsyncClient):
@@ -194,8 +193,6 @@ async def add_existing_document(client: xai_sdk.AsyncClient, collection_id: str,
 
 
 async def list_documents(client: xai_sdk.AsyncClient, collection_id: str):
-    print("\n=== List Documents ===")
-
     response = await client.collections.list_documents(
         collection_id,
         limit=10,
@@ -203,14 +200,15 @@ async def list_documents(client: xai_sdk.AsyncClient, collection_id: str):
         sort_by="age",
     )
 
-    print(f"Found {len(response.documents)} documents:")
+    lines = ["\n=== List Documents ===", f"Found {len(response.documents)} documents:"]
     for doc in response.documents:
-        print(f"  - {doc.file_metadata.name}")
-        print(f"    File ID: {doc.file_metadata.file_id}")
-        print(f"    Size: {doc.file_metadata.size_bytes} bytes")
-        print(f"    Status: {doc.status}")
+        lines.append(f"  - {doc.file_metadata.name}")
+        lines.append(f"    File ID: {doc.file_metadata.file_id}")
+        lines.append(f"    Size: {doc.file_metadata.size_bytes} bytes")
+        lines.append(f"    Status: {doc.status}")
         if doc.fields:
-            print(f"    Fields: {dict(doc.fields)}")
+            lines.append(f"    Fields: {dict(doc.fields)}")
+    print("\n".join(lines))
 
 
 async def list_documents_with_filter(client: xai_sdk.AsyncClient, collection_id: str):
@@ -312,79 +310,115 @@ async def delete_collection(client: xai_sdk.AsyncClient, collection_id: str):
     print(f"Deleted collection (ID: {collection_id})")
 
 
+def _report_failures(action: str, ids: list[str], results: list) -> bool:
+    """Prints the calls in `results` that raised and returns whether there were any."""
+    failed = False
+    for id_, result in zip(ids, results, strict=True):
+        if isinstance(result, BaseException):
+            print(f"Failed to {action} {id_}: {result}")
+            failed = True
+    return failed
+
+
 async def run_examples():
     async with xai_sdk.AsyncClient() as client:
+        # The examples form a small dependency graph. Each step is started as soon as the IDs it needs are available and
+        # only waits on the steps it actually depends on, so independent steps overlap and the total run time is bounded
+        # by the longest chain of dependent steps.
+
         # Create collections with different chunking strategies
-        collection_id = await create_collection(client)
-        collection_id_2 = await create_collection_with_token_chunking(client)
-        collection_id_3 = await create_collection_with_bytes_chunking(client)
-
-        # List collections (with and without filter)
-        await list_collections(client)
-        await list_collections_with_filter(client)
-
-        # Get collection metadata
-        await get_collection(client, collection_id)
-
-        # Update collection (name, chunk config, description, and field definitions)
-        await update_collection(client, collection_id)
-
-        # Upload documents
-        file_id = await upload_document(
-            client,
-            collection_id,
-            "ml-fundamentals.txt",
-            b"Machine learning is a subset of artificial intelligence that focuses on building "
-            b"systems that can learn from data and improve their performance over time without "
-            b"being explicitly programmed.",
-            fields={"topic": "machine-learning", "level": "beginner"},
-        )
-
-        file_id_2 = await upload_document(
-            client,
-            collection_id,
-            "deep-learning.txt",
-            b"Deep learning is a subset of machine learning that uses neural networks with "
-            b"multiple layers. These networks can learn hierarchical representations of data, "
-            b"making them particularly effective for tasks like image recognition and natural "
-            b"language processing.",
-        )
-
-        # Add an existing document to another collection
-        await add_existing_document(client, collection_id_2, file_id)
-
-        # List documents (with and without filter)
-        await list_documents(client, collection_id)
-        await list_documents_with_filter(client, collection_id)
-
-        # Get document metadata
-        await get_document(client, collection_id, file_id)
-
-        # Batch get documents
-        await batch_get_documents(client, collection_id, [file_id, file_id_2])
-
-        # Update a document
-        await update_document(client, collection_id, file_id)
-
-        # Search documents
-        await search(client, collection_id)
-
-        # Generate a description from collection contents
-        await generate_description(client, collection_id)
-
-        # Reindex document (useful after updating collection configuration)
-        await reindex_document(client, collection_id, file_id)
-
-        # Remove documents from collection
-        await remove_document(client, collection_id, file_id)
-        await remove_document(client, collection_id, file_id_2)
-
-        # Delete collections (cleanup)
-        await delete_collection(client, collection_id)
-        await delete_collection(client, collection_id_2)
-        await delete_collection(client, collection_id_3)
-
-        print("\n=== All examples completed successfully! ===")
+        collection_tasks = [
+            asyncio.create_task(create_collection(client)),
+            asyncio.create_task(create_collection_with_token_chunking(client)),
+            asyncio.create_task(create_collection_with_bytes_chunking(client)),
+        ]
+
+        cleanup_failed = False
+        try:
+            collection_id = await collection_tasks[0]
+
+            # Get collection metadata
+            await get_collection(client, collection_id)
+
+            # Update collection (name, chunk config, description, and field definitions). This happens before the
+            # uploads so the documents are chunked with the updated configuration.
+            await update_collection(client, collection_id)
+
+            # Upload documents
+            file_id, file_id_2 = await asyncio.gather(
+                upload_document(
+                    client,
+                    collection_id,
+                    "ml-fundamentals.txt",
+                    b"Machine learning is a subset of artificial intelligence that focuses on building "
+                    b"systems that can learn from data and improve their performance over time without "
+                    b"being explicitly programmed.",
+                    fields={"topic": "machine-learning", "level": "beginner"},
+                ),
+                upload_document(
+                    client,
+                    collection_id,
+                    "deep-learning.txt",
+                    b"Deep learning is a subset of machine learning that uses neural networks with "
+                    b"multiple layers. These networks can learn hierarchical representations of data, "
+                    b"making them particularly effective for tasks like image recognition and natural "
+                    b"language processing.",
+                ),
+            )
+
+            async def add_to_second_collection():
+                # Add an existing document to another collection
+                await add_existing_document(client, await collection_tasks[1], file_id)
+
+            # Add the document to the second collection, list documents (with and without filter), get document
+            # metadata, batch get documents and generate a description from the collection contents. None of these
+            # modify the documents in the first collection, so they can run concurrently.
+            await asyncio.gather(
+                add_to_second_collection(),
+                list_documents(client, collection_id),
+                list_documents_with_filter(client, collection_id),
+                get_document(client, collection_id, file_id),
+                batch_get_documents(client, collection_id, [file_id, file_id_2]),
+                generate_description(client, collection_id),
+            )
+
+            # Update a document
+            await update_document(client, collection_id, file_id)
+
+            # Search documents
+            await search(client, collection_id)
+
+            # Reindex the updated document (useful after updating collection configuration)
+            await reindex_document(client, collection_id, file_id)
+
+            # List collections (with and without filter) once all of them have been created and updated, so the
+            # listing shows their final state.
+            await asyncio.gather(*collection_tasks)
+            await list_collections(client)
+            await list_collections_with_filter(client)
+
+            # Remove documents from collection. Failures are reported rather than raised so that one failed call
+            # doesn't prevent the rest of the cleanup.
+            file_ids = [file_id, file_id_2]
+            results = await asyncio.gather(
+                *(remove_document(client, collection_id, f) for f in file_ids),
+                return_exceptions=True,
+            )
+            cleanup_failed = _report_failures("remove document", file_ids, results)
+        finally:
+            # Delete collections (cleanup). This also runs if a step failed, for every collection that was created.
+            created = await asyncio.gather(*collection_tasks, return_exceptions=True)
+            collection_ids = [c for c in created if isinstance(c, str)]
+            results = await asyncio.gather(
+                *(delete_collection(client, c) for c in collection_ids),
+                return_exceptions=True,
+            )
+            cleanup_failed |= _report_failures("delete collection", collection_ids, results)
+
+        if cleanup_failed:
+            print("\n=== All examples completed, but some cleanup steps failed ===")
+        else:
+            print("\n=== All examples completed successfully! ===")
 
 
 def main() -> None:
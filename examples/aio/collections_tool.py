@@ -1,4 +1,7 @@
 import asyncio
+import sys
+import tempfile
+import time
 
 import httpx
 
@@ -9,29 +12,45 @@ from xai_sdk.tools import collections_search
 TESLA_10_Q_PDF_URL = "https://ir.tesla.com/_flysystem/s3/sec/000162828025045968/tsla-20250930-gen.pdf"
 TESLA_10_K_PDF_URL = "https://ir.tesla.com/_flysystem/s3/sec/000162828025003063/tsla-20241231-gen.pdf"
 
+# The "Thinking..." progress line is redrawn at most this often.
+PROGRESS_INTERVAL_SECONDS = 0.1
+
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
 
 async def agentic_collections_search(client: AsyncClient, model: str) -> None:
     response = await client.collections.create("tesla-sec-filings")
     print(f"Created collection: {response.collection_id}")
 
-    async def upload_document(url: str, name: str, collection_id: str) -> None:
-        async with httpx.AsyncClient() as http_client:
-            pdf_response = await http_client.get(url, timeout=30.0)
-            pdf_content = pdf_response.content
-
-        print(f"Uploading {name} document to collection")
-        await client.collections.upload_document(
-            collection_id=collection_id,
-            name=name,
-            data=pdf_content,
-            wait_for_indexing=True,
-        )
+    async def upload_document(http_client: httpx.AsyncClient, url: str, name: str, collection_id: str) -> None:
+        # Stream the PDF into a spooled temporary file (kept in memory up to 8 MiB, on disk beyond that) and
+        # hand the file object to the SDK, which uploads it in chunks without buffering the whole body again.
+        with tempfile.SpooledTemporaryFile(max_size=8 << 20) as pdf_file:
+            async with http_client.stream("GET", url) as pdf_response:
+                pdf_response.raise_for_status()
+                async for chunk in pdf_response.aiter_bytes(65536):
+                    pdf_file.write(chunk)
+            pdf_file.seek(0)
+
+            print(f"Uploading {name} document to collection")
+            await client.collections.upload_document(
+                collection_id=collection_id,
+                name=name,
+                data=pdf_file,
+                wait_for_indexing=True,
+            )
         print(f"Uploaded {name} document to collection")
 
-    await asyncio.gather(
-        upload_document(TESLA_10_Q_PDF_URL, "tesla-10-Q-2024.pdf", response.collection_id),
-        upload_document(TESLA_10_K_PDF_URL, "tesla-10-K-2024.pdf", response.collection_id),
-    )
+    # Share one pooled HTTP client between both downloads so connections to the same host can be reused.
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(30.0),
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+    ) as http_client:
+        await asyncio.gather(
+            upload_document(http_client, TESLA_10_Q_PDF_URL, "tesla-10-Q-2024.pdf", response.collection_id),
+            upload_document(http_client, TESLA_10_K_PDF_URL, "tesla-10-K-2024.pdf", response.collection_id),
+        )
 
     chat = client.chat.create(
         model=model,
@@ -52,17 +71,26 @@ async def agentic_collections_search(client: AsyncClient, model: str) -> None:
     )
 
     is_thinking = True
+    last_progress = 0.0
+    last_flush = time.monotonic()
     async for response, chunk in chat.stream():
         for tool_call in chunk.tool_calls:
             print(f"\nCalling tool: {tool_call.function.name} with arguments: {tool_call.function.arguments}")
         if response.usage.reasoning_tokens and is_thinking:
-            print(f"\rThinking... ({response.usage.reasoning_tokens} tokens)", end="", flush=True)
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL_SECONDS:
+                print(f"\rThinking... ({response.usage.reasoning_tokens} tokens)", end="", flush=True)
+                last_progress = now
         if chunk.content and is_thinking:
             print("\n\nFinal Response:")
             is_thinking = False
         if chunk.content and not is_thinking:
-            print(chunk.content, end="", flush=True)
+            sys.stdout.write(chunk.content)
         latest_response = response
+        if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+            sys.stdout.flush()
+            last_flush = time.monotonic()
+    sys.stdout.flush()
 
     print("\n\nCitations:")
     print(latest_response.citations)
@@ -74,8 +102,8 @@ async def agentic_collections_search(client: AsyncClient, model: str) -> None:
 
 
 async def main() -> None:
-    client = AsyncClient()
-    await agentic_collections_search(client, model="grok-4.20")
+    async with AsyncClient() as client:
+        await agentic_collections_search(client, model="grok-4.20")
 
 
 if __name__ == "__main__":
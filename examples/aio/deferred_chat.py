@@ -1,6 +1,6 @@
 import asyncio
 from datetime import timedelta
-from typing import Sequence
+from typing import Optional, Sequence
 
 from absl import app, flags
 
@@ -8,7 +8,17 @@ from xai_sdk import AsyncClient
 from xai_sdk.chat import user
 
 TIMEOUT = flags.DEFINE_integer("timeout", 5, "Timeout for the deferred chat request.")
-INTERVAL = flags.DEFINE_integer("interval", 2000, "Interval for the deferred chat request.")
+INTERVAL = flags.DEFINE_integer(
+    "interval",
+    None,
+    "Fixed polling interval in milliseconds for the deferred chat request. If omitted, polling starts at 100ms and "
+    "backs off up to 2s.",
+)
+
+
+def _poll_interval() -> Optional[timedelta]:
+    """Returns the fixed polling interval, if one was given. Otherwise the SDK polls with an increasing interval."""
+    return timedelta(milliseconds=INTERVAL.value) if INTERVAL.value is not None else None
 
 
 # see https://docs.x.ai/docs/guides/deferred-chat-completions#deferred-chat-completions
@@ -20,9 +30,7 @@ async def deferred_chat(client: AsyncClient):
     chat = client.chat.create(model="grok-4.20-non-reasoning")
     chat.append(user("Hello"))
     try:
-        response = await chat.defer(
-            timeout=timedelta(minutes=TIMEOUT.value), interval=timedelta(milliseconds=INTERVAL.value)
-        )
+        response = await chat.defer(timeout=timedelta(minutes=TIMEOUT.value), interval=_poll_interval())
         print(response.content)
     except RuntimeError as e:
         # request expired
@@ -37,9 +45,7 @@ async def batch_deferred_chat(client: AsyncClient):
     chat = client.chat.create(model="grok-4.20-non-reasoning")
     chat.append(user("Hello"))
     try:
-        responses = await chat.defer_batch(
-            n=10, timeout=timedelta(minutes=TIMEOUT.value), interval=timedelta(milliseconds=INTERVAL.value)
-        )
+        responses = await chat.defer_batch(n=10, timeout=timedelta(minutes=TIMEOUT.value), interval=_poll_interval())
         for response in responses:
             print(response.content)
     except RuntimeError as e:
@@ -50,12 +56,32 @@ async def batch_deferred_chat(client: AsyncClient):
         print(e)
 
 
+async def deferred_chat_as_completed(client: AsyncClient):
+    """Sample multiple responses from a model using polling, printing each one as soon as it is ready.
+
+    Each response is a separate request, so the prompt is billed once per response.
+    """
+    chat = client.chat.create(model="grok-4.20-non-reasoning")
+    chat.append(user("Hello"))
+    try:
+        async for response in chat.defer_as_completed(
+            n=3, timeout=timedelta(minutes=TIMEOUT.value), interval=_poll_interval()
+        ):
+            print(response.content)
+    except RuntimeError as e:
+        # request expired
+        print(e)
+    except ValueError as e:
+        # unknown deferred status
+        print(e)
+
+
 async def main(argv: Sequence[str]) -> None:
     if len(argv) > 1:
         raise app.UsageError("Unexpected command line arguments.")
 
-    client = AsyncClient()
-    await deferred_chat(client)
+    async with AsyncClient() as client:
+        await deferred_chat(client)
 
 
 if __name__ == "__main__":
@@ -10,15 +10,35 @@ from tqdm import tqdm
 import xai_sdk
 
 
+def _create_sparse_file(file_size: int) -> str:
+    """Create a temporary file of the given size and return its path.
+
+    The file is extended with a single `truncate` call instead of being written out, so on most filesystems it is
+    created sparse and reads back as zeros without any data being written to disk.
+    """
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
+        f.truncate(file_size)
+        return f.name
+
+
+def _write_temp_file(data: bytes, suffix: str) -> str:
+    """Write `data` to a new temporary file and return its path."""
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=suffix, delete=False) as f:
+        f.write(data)
+        return f.name
+
+
 async def upload_example(client: xai_sdk.AsyncClient):
     """Demonstrate file upload asynchronously."""
     print("\n=== Upload Example ===")
 
-    # Create a temporary file to upload
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write("This is a test file for the Files API.\n")
-        f.write("It demonstrates uploading files to the xAI platform.\n")
-        temp_file_path = f.name
+    # Create a temporary file to upload. File I/O is blocking, so it runs in a worker thread to keep the event
+    # loop free for the other uploads running concurrently.
+    temp_file_path = await asyncio.to_thread(
+        _write_temp_file,
+        b"This is a test file for the Files API.\nIt demonstrates uploading files to the xAI platform.\n",
+        ".txt",
+    )
 
     try:
         # Upload the file
@@ -30,7 +50,7 @@ async def upload_example(client: xai_sdk.AsyncClient):
         return file.id
     finally:
         # Clean up temporary file
-        os.unlink(temp_file_path)
+        await asyncio.to_thread(os.unlink, temp_file_path)
 
 
 async def upload_bytes_example(client: xai_sdk.AsyncClient):
@@ -60,10 +80,9 @@ async def upload_file_object_example(client: xai_sdk.AsyncClient):
     print(f"File size: {file.size} bytes")
 
     # Example 2: Upload from opened file (filename auto-detected from file.name)
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".dat", delete=False) as f:
-        f.write(b"Data written to temp file for upload via file object.")
-        temp_path = f.name
-
+    temp_path = await asyncio.to_thread(
+        _write_temp_file, b"Data written to temp file for upload via file object.", ".dat"
+    )
     try:
         with open(temp_path, "rb") as f:
             # filename is automatically detected from f.name
@@ -72,7 +91,18 @@ async def upload_file_object_example(client: xai_sdk.AsyncClient):
             print(f"File ID: {file2.id}")
             print(f"File size: {file2.size} bytes")
     finally:
-        os.unlink(temp_path)
+        await asyncio.to_thread(os.unlink, temp_path)
+
+    # Example 3: Upload from an in-memory file object with a .name attribute (filename auto-detected from it).
+    # No temporary file is needed: any binary file-like object is streamed the same way as an opened file.
+    file_obj_3 = io.BytesIO(b"Data uploaded via a named file object.")
+    file_obj_3.name = "file_object_example.dat"  # type: ignore[attr-defined]
+
+    # filename is automatically detected from file_obj_3.name
+    file3 = await client.files.upload(file_obj_3)
+    print(f"Uploaded from in-memory file object: {file3.filename}")
+    print(f"File ID: {file3.id}")
+    print(f"File size: {file3.size} bytes")
 
     return file.id
 
@@ -83,14 +113,10 @@ async def upload_large_file_example(client: xai_sdk.AsyncClient):
 
     # Create a temporary 48MB file
     file_size = 48 * 1024 * 1024  # 48 MB
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
-        write_chunk_size = 1024 * 1024  # 1 MB write chunks
-        for _ in range(file_size // write_chunk_size):
-            f.write(b"X" * write_chunk_size)
-        temp_file_path = f.name
+    temp_file_path = await asyncio.to_thread(_create_sparse_file, file_size)
 
     try:
-        print(f"Created temporary 100MB file: {temp_file_path}")
+        print(f"Created temporary 48MB file: {temp_file_path}")
         print("Uploading file...")
 
         # Upload the file - the SDK will automatically stream it in chunks
@@ -104,7 +130,7 @@ async def upload_large_file_example(client: xai_sdk.AsyncClient):
     finally:
         # Clean up temporary file
         print("Cleaning up temporary file...")
-        os.unlink(temp_file_path)
+        await asyncio.to_thread(os.unlink, temp_file_path)
 
 
 async def upload_with_progress_tqdm_example(client: xai_sdk.AsyncClient):
@@ -113,11 +139,7 @@ async def upload_with_progress_tqdm_example(client: xai_sdk.AsyncClient):
 
     # Create a temporary 10MB file
     file_size = 10 * 1024 * 1024  # 10 MB
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
-        write_chunk_size = 1024 * 1024  # 1 MB write chunks
-        for _ in range(file_size // write_chunk_size):
-            f.write(b"X" * write_chunk_size)
-        temp_file_path = f.name
+    temp_file_path = await asyncio.to_thread(_create_sparse_file, file_size)
 
     try:
         total_bytes = os.path.getsize(temp_file_path)
@@ -135,7 +157,7 @@ async def upload_with_progress_tqdm_example(client: xai_sdk.AsyncClient):
         return file.id
     finally:
         # Clean up temporary file
-        os.unlink(temp_file_path)
+        await asyncio.to_thread(os.unlink, temp_file_path)
 
 
 async def upload_with_progress_callback_example(client: xai_sdk.AsyncClient):
@@ -144,11 +166,7 @@ async def upload_with_progress_callback_example(client: xai_sdk.AsyncClient):
 
     # Create a temporary 5MB file
     file_size = 5 * 1024 * 1024  # 5 MB
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
-        write_chunk_size = 1024 * 1024  # 1 MB write chunks
-        for _ in range(file_size // write_chunk_size):
-            f.write(b"X" * write_chunk_size)
-        temp_file_path = f.name
+    temp_file_path = await asyncio.to_thread(_create_sparse_file, file_size)
 
     try:
         # Define a custom progress callback
@@ -171,7 +189,7 @@ async def upload_with_progress_callback_example(client: xai_sdk.AsyncClient):
         return file.id
     finally:
         # Clean up temporary file
-        os.unlink(temp_file_path)
+        await asyncio.to_thread(os.unlink, temp_file_path)
 
 
 async def batch_upload_example(client: xai_sdk.AsyncClient):
@@ -183,11 +201,17 @@ async def batch_upload_example(client: xai_sdk.AsyncClient):
     num_files = 20
 
     try:
-        for i in range(num_files):
-            with tempfile.NamedTemporaryFile(mode="w", suffix=f"_batch_{i}.txt", delete=False) as f:
-                f.write(f"This is test file #{i + 1} for batch upload.\n")
-                f.write("Demonstrating concurrent file uploads.\n")
-                temp_files.append(f.name)
+        # Create the files concurrently in worker threads
+        temp_files = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    _write_temp_file,
+                    f"This is test file #{i + 1} for batch upload.\nDemonstrating concurrent file uploads.\n".encode(),
+                    f"_batch_{i}.txt",
+                )
+                for i in range(num_files)
+            )
+        )
 
         print(f"Created {num_files} temporary files")
         print("Uploading files in batch with progress tracking...\n")
@@ -207,7 +231,8 @@ async def batch_upload_example(client: xai_sdk.AsyncClient):
                 success_count += 1
                 print(f"[{completed_count}/{num_files}] Success: {result.filename} ({result.size} bytes)")
 
-        # Batch upload all files with controlled concurrency and progress callback
+        # Batch upload all files with at most 3 uploads in flight. Each finished upload immediately frees its slot
+        # for the next file, so a single slow upload doesn't hold back the others.
         results = await client.files.batch_upload(temp_files, batch_size=3, on_file_complete=on_file_complete)
 
         print("\nBatch upload complete!")
@@ -219,8 +244,7 @@ async def batch_upload_example(client: xai_sdk.AsyncClient):
 
     finally:
         # Clean up temporary files
-        for temp_file in temp_files:
-            os.unlink(temp_file)
+        await asyncio.gather(*(asyncio.to_thread(os.unlink, temp_file) for temp_file in temp_files))
 
 
 async def list_example(client: xai_sdk.AsyncClient):
@@ -258,56 +282,68 @@ async def get_example(client: xai_sdk.AsyncClient, file_id: str):
 
 
 async def get_content_example(client: xai_sdk.AsyncClient, file_id: str):
-    """Demonstrate getting file content and writing it to a file asynchronously."""
+    """Demonstrate getting file content asynchronously."""
     print("\n=== Get File Content Example ===")
 
     # Download the file content
     content = await client.files.content(file_id)
     print(f"Retrieved {len(content)} bytes of content")
 
-    # Write the content to a temporary file
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".txt", delete=False) as f:
-        f.write(content)
+    # If it's text content, print a preview
+    preview_length = 200
+    try:
+        text_content = content.decode("utf-8")
+        preview = text_content[:preview_length]
+        if len(text_content) > preview_length:
+            preview += "..."
+        print(f"Content preview: {preview}")
+    except UnicodeDecodeError:
+        print("(Binary content, cannot display as text)")
+
+
+async def download_content_example(client: xai_sdk.AsyncClient, file_id: str):
+    """Demonstrate streaming file content to a file asynchronously."""
+    print("\n=== Download File Content Example ===")
+
+    # Write the content to a temporary file chunk by chunk as it is downloaded, so the file is never held in memory
+    size = 0
+    f = await asyncio.to_thread(tempfile.NamedTemporaryFile, mode="wb", suffix=".txt", delete=False)
+    with f:
+        async for chunk in client.files.iter_content(file_id):
+            await asyncio.to_thread(f.write, chunk)
+            size += len(chunk)
         downloaded_path = f.name
 
-    try:
-        print(f"Content written to: {downloaded_path}")
-
-        # If it's text content, print a preview
-        preview_length = 200
-        try:
-            text_content = content.decode("utf-8")
-            preview = text_content[:preview_length]
-            if len(text_content) > preview_length:
-                preview += "..."
-            print(f"Content preview: {preview}")
-        except UnicodeDecodeError:
-            print("(Binary content, cannot display as text)")
-    finally:
-        # Clean up the downloaded file
-        os.unlink(downloaded_path)
+    print(f"Wrote {size} bytes of content to: {downloaded_path}")
 
+    # Clean up the downloaded file
+    await asyncio.to_thread(os.unlink, downloaded_path)
 
-async def delete_example(client: xai_sdk.AsyncClient, file_id: str):
-    """Demonstrate deleting a file asynchronously."""
+
+async def delete_example(client: xai_sdk.AsyncClient, file_ids: list[str]):
+    """Demonstrate deleting files concurrently."""
     print("\n=== Delete Example ===")
 
-    response = await client.files.delete(file_id)
-    print(f"Deleted file ID: {response.id}")
-    print(f"Deletion successful: {response.deleted}")
+    # The deletions are independent, so they are issued concurrently. Failures are reported rather than raised so
+    # that one failed deletion doesn't prevent the others.
+    responses = await asyncio.gather(*(client.files.delete(file_id) for file_id in file_ids), return_exceptions=True)
+    for file_id, response in zip(file_ids, responses, strict=True):
+        if isinstance(response, BaseException):
+            print(f"Failed to delete file ID {file_id}: {response}")
+        else:
+            print(f"Deleted file ID: {response.id} (successful: {response.deleted})")
 
 
 async def run_examples():
     """Run all files API examples asynchronously."""
     async with xai_sdk.AsyncClient() as client:
-        # Upload a file and get its ID
-        file_id = await upload_example(client)
-
-        # Upload from bytes
-        file_id_2 = await upload_bytes_example(client)
-
-        # Upload from file-like object
-        file_id_3 = await upload_file_object_example(client)
+        # Upload a file from a path, from bytes and from a file-like object. The uploads are independent,
+        # so they run concurrently over the same channel.
+        file_id, file_id_2, file_id_3 = await asyncio.gather(
+            upload_example(client),
+            upload_bytes_example(client),
+            upload_file_object_example(client),
+        )
 
         # Upload with tqdm progress bar
         file_id_4 = await upload_with_progress_tqdm_example(client)
@@ -331,19 +367,11 @@ async def run_examples():
         # Get file content
         await get_content_example(client, file_id)
 
-        # Delete files (cleanup)
-        await delete_example(client, file_id)
-        await delete_example(client, file_id_2)
-        await delete_example(client, file_id_3)
-        await delete_example(client, file_id_4)
-        await delete_example(client, file_id_5)
-
-        # Delete batch uploaded files
-        for file_id in batch_file_ids:
-            await delete_example(client, file_id)
+        # Download file content to disk
+        await download_content_example(client, file_id)
 
-        # Uncomment if you ran the large file upload
-        # await delete_example(client, file_id_large)
+        # Delete all uploaded files (cleanup). Add file_id_large if you ran the large file upload.
+        await delete_example(client, [file_id, file_id_2, file_id_3, file_id_4, file_id_5, *batch_file_ids])
 
         print("\n=== All examples completed successfully! ===")
 
@@ -2,11 +2,16 @@
 
 import asyncio
 import os
+import sys
 import tempfile
+import time
 
 from xai_sdk import AsyncClient
 from xai_sdk.chat import file, user
 
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
 
 async def chat_with_file(client: AsyncClient, file_path: str, query: str) -> None:
     """Create a chat with a file attachment and stream the response."""
@@ -25,10 +30,15 @@ async def chat_with_file(client: AsyncClient, file_path: str, query: str) -> Non
     print("Response:")
     print("-" * 80)
     final_response = None
+    last_flush = time.monotonic()
     async for response, chunk in chat.stream():
         final_response = response
         if chunk.content:
-            print(chunk.content, end="", flush=True)
+            sys.stdout.write(chunk.content)
+        if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+            sys.stdout.flush()
+            last_flush = time.monotonic()
+    sys.stdout.flush()
     print("\n" + "-" * 80)
 
     # Show usage stats
@@ -42,8 +52,6 @@ async def chat_with_file(client: AsyncClient, file_path: str, query: str) -> Non
 
 async def main() -> None:
     """Run the file chat example."""
-    client = AsyncClient()
-
     # Create a sample document
     document_content = """
     Quarterly Sales Report - Q4 2024
@@ -81,11 +89,12 @@ async def main() -> None:
 
     try:
         # Chat with the file
-        await chat_with_file(
-            client,
-            temp_file_path,
-            "Please analyze this sales report and provide the top 3 key takeaways.",
-        )
+        async with AsyncClient() as client:
+            await chat_with_file(
+                client,
+                temp_file_path,
+                "Please analyze this sales report and provide the top 3 key takeaways.",
+            )
     finally:
         os.unlink(temp_file_path)
 
@@ -1,5 +1,7 @@
 import asyncio
 import json
+import sys
+import time
 from typing import Literal, Sequence
 
 from absl import app, flags
@@ -10,6 +12,19 @@ from xai_sdk.chat import system, tool, tool_result, user
 
 STREAM = flags.DEFINE_bool("stream", False, "Whether streaming is enabled.")
 
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
+
+# Define the shape of the tool call arguments as a Pydantic model.
+class GetWeatherRequest(BaseModel):
+    city: str = Field(description="The name of the city to get the weather for.")
+    units: Literal["C", "F"] = Field(description="The units to use for the temperature.")
+
+
+# Generate the json schema from the Pydantic model once, rather than every time the tool is defined.
+GET_WEATHER_PARAMETERS = GetWeatherRequest.model_json_schema()
+
 
 async def function_calling(client: AsyncClient) -> None:
     """Multi-turn chat with function calling."""
@@ -45,7 +60,7 @@ async def function_calling(client: AsyncClient) -> None:
     )
 
     while True:
-        user_input = input("You: ")
+        user_input = await asyncio.to_thread(input, "You: ")
 
         if user_input.lower() == "exit":
             break
@@ -76,11 +91,6 @@ async def function_calling(client: AsyncClient) -> None:
 async def function_calling_streaming(client: AsyncClient) -> None:
     """Multi-turn chat with function calling and streaming."""
 
-    # Define the shape of the tool call arguments as a Pydantic model.
-    class GetWeatherRequest(BaseModel):
-        city: str = Field(description="The name of the city to get the weather for.")
-        units: Literal["C", "F"] = Field(description="The units to use for the temperature.")
-
     def get_weather(request: GetWeatherRequest) -> str:
         temperature = 20 if request.units == "C" else 68
         return f"The weather in {request.city} is sunny at a temperature of {temperature} {request.units}."
@@ -92,14 +102,13 @@ async def function_calling_streaming(client: AsyncClient) -> None:
             tool(
                 name="get_weather",
                 description="Get the weather for a given city.",
-                # Generate the json schema from the Pydantic model.
-                parameters=GetWeatherRequest.model_json_schema(),
+                parameters=GET_WEATHER_PARAMETERS,
             )
         ],
     )
 
     while True:
-        user_input = input("You: ")
+        user_input = await asyncio.to_thread(input, "You: ")
 
         if user_input.lower() == "exit":
             break
@@ -109,9 +118,14 @@ async def function_calling_streaming(client: AsyncClient) -> None:
         print("Grok: ", end="", flush=True)
 
         last_response = None
+        last_flush = time.monotonic()
         async for response, chunk in stream:
-            print(chunk.content, end="", flush=True)
+            sys.stdout.write(chunk.content)
             last_response = response
+            if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+                sys.stdout.flush()
+                last_flush = time.monotonic()
+        sys.stdout.flush()
 
         assert last_response is not None
         chat.append(last_response)
@@ -125,9 +139,14 @@ async def function_calling_streaming(client: AsyncClient) -> None:
 
             stream = chat.stream()
             last_response = None
+            last_flush = time.monotonic()
             async for response, chunk in stream:
-                print(chunk.content, end="", flush=True)
+                sys.stdout.write(chunk.content)
                 last_response = response
+                if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+                    sys.stdout.flush()
+                    last_flush = time.monotonic()
+            sys.stdout.flush()
 
             assert last_response is not None
             chat.append(last_response)
@@ -139,12 +158,11 @@ async def main(argv: Sequence[str]) -> None:
     if len(argv) > 1:
         raise app.UsageError("Unexpected command line arguments.")
 
-    client = AsyncClient()
-
-    if STREAM.value:
-        await function_calling_streaming(client)
-    else:
-        await function_calling(client)
+    async with AsyncClient() as client:
+        if STREAM.value:
+            await function_calling_streaming(client)
+        else:
+            await function_calling(client)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import asyncio
 import itertools
 import os
+from pathlib import Path
 from typing import Sequence, cast
 
 from absl import app, flags
@@ -25,9 +26,9 @@ async def generate_multi_turn(client: xai_sdk.AsyncClient, image_format: ImageFo
 
     for turn in itertools.count():
         if previous_image is None:
-            prompt = input("Prompt (blank to stop): ")
+            prompt = await asyncio.to_thread(input, "Prompt (blank to stop): ")
         else:
-            prompt = input("Edit prompt (blank to stop): ")
+            prompt = await asyncio.to_thread(input, "Edit prompt (blank to stop): ")
         if not prompt:
             return
 
@@ -52,7 +53,9 @@ async def generate_multi_turn(client: xai_sdk.AsyncClient, image_format: ImageFo
 
         selected = 0
         if len(responses) > 1:
-            raw = input(f"Continue from which image? [0-{len(responses) - 1}] (default 0): ").strip()
+            raw = (
+                await asyncio.to_thread(input, f"Continue from which image? [0-{len(responses) - 1}] (default 0): ")
+            ).strip()
             if raw:
                 selected = int(raw)
                 if selected < 0 or selected >= len(responses):
@@ -70,9 +73,14 @@ async def generate_multi_turn(client: xai_sdk.AsyncClient, image_format: ImageFo
 
 async def _save_images(turn: int, responses: Sequence[ImageResponse]):
     """Save images to a file."""
-    for i, image in enumerate(responses):
-        with open(f"{OUTPUT_DIR.value}/image_{turn}_{i}.jpg", "wb") as f:
-            f.write(await image.image)
+    # Fetch all images concurrently, then write them out in worker threads so the event loop isn't blocked on disk I/O.
+    payloads = await asyncio.gather(*(image.image for image in responses))
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(Path(f"{OUTPUT_DIR.value}/image_{turn}_{i}.jpg").write_bytes, payload)
+            for i, payload in enumerate(payloads)
+        )
+    )
 
 
 async def main(argv: Sequence[str]) -> None:
@@ -81,9 +89,16 @@ async def main(argv: Sequence[str]) -> None:
 
     os.makedirs(OUTPUT_DIR.value, exist_ok=True)
 
-    client = xai_sdk.AsyncClient()
-    image_format: ImageFormat = cast(ImageFormat, FORMAT.value)
-    await generate_multi_turn(client, image_format)
+    async with xai_sdk.AsyncClient() as client:
+        image_format: ImageFormat = cast(ImageFormat, FORMAT.value)
+
+        # Connect in the background while the user types the first prompt, so that the first request doesn't also pay
+        # for the connection handshake.
+        connecting = asyncio.create_task(client.connect())
+        try:
+            await generate_multi_turn(client, image_format)
+        finally:
+            connecting.cancel()
 
 
 if __name__ == "__main__":
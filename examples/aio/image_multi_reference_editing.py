@@ -10,6 +10,7 @@ Example:
 
 import asyncio
 import os
+from pathlib import Path
 from typing import Sequence, cast
 
 from absl import app, flags
@@ -56,9 +57,13 @@ async def edit_images(client: xai_sdk.AsyncClient, image_format: ImageFormat) ->
 
 async def save_images(responses: Sequence[ImageResponse]) -> None:
     """Save images to a file."""
-    for i, image in enumerate(responses):
-        with open(f"{OUTPUT_DIR.value}/image_{i}.jpg", "wb") as f:
-            f.write(await image.image)
+    payloads = await asyncio.gather(*(image.image for image in responses))
+    await asyncio.gather(
+        *(
+            asyncio.to_thread(Path(f"{OUTPUT_DIR.value}/image_{i}.jpg").write_bytes, payload)
+            for i, payload in enumerate(payloads)
+        )
+    )
 
 
 async def main(argv: Sequence[str]) -> None:
@@ -68,17 +73,17 @@ async def main(argv: Sequence[str]) -> None:
     if FORMAT.value != "url" and not OUTPUT_DIR.value:
         raise app.UsageError("--output-dir is required when --format is not url.")
 
-    client = xai_sdk.AsyncClient()
-    image_format: ImageFormat = cast(ImageFormat, FORMAT.value)
-    responses = await edit_images(client, image_format)
+    async with xai_sdk.AsyncClient() as client:
+        image_format: ImageFormat = cast(ImageFormat, FORMAT.value)
+        responses = await edit_images(client, image_format)
 
-    if image_format == "url":
-        for i, image in enumerate(responses):
-            print(f"Image {i} URL: {image.url}")
-        return
+        if image_format == "url":
+            for i, image in enumerate(responses):
+                print(f"Image {i} URL: {image.url}")
+            return
 
-    os.makedirs(OUTPUT_DIR.value, exist_ok=True)  # type: ignore
-    await save_images(responses)
+        os.makedirs(OUTPUT_DIR.value, exist_ok=True)  # type: ignore
+        await save_images(responses)
 
 
 if __name__ == "__main__":
@@ -1,129 +1,150 @@
 import asyncio
-from typing import Sequence
+from typing import Callable, Sequence, TypeVar
 
 from absl import app, flags
 
 from xai_sdk import AsyncClient
+from xai_sdk.proto import models_pb2
 
 OPERATION = flags.DEFINE_enum("operation", "list", ["list", "get"], "Operation to perform.")
-MODEL_TYPE = flags.DEFINE_enum("model-type", None, ["language", "embedding", "image"], "Model type to list.")
+MODEL_TYPE = flags.DEFINE_enum(
+    "model-type", None, ["language", "embedding", "image", "all"], "Model type. Lists every type if omitted."
+)
 MODEL_NAME = flags.DEFINE_string("model-name", None, "Model name to get.")
 
+ModelT = TypeVar("ModelT")
+
+# Models are formatted into one string before printing, so that each listing is printed with a single write.
+
+
+def _format_language_model(model: models_pb2.LanguageModel) -> str:
+    """Formats a language model as a single block of text."""
+    return (
+        f"Model name: {model.name}\n"
+        f"Aliases: {model.aliases}\n"
+        f"Version: {model.version}\n"
+        f"Input modalities: {model.input_modalities}\n"
+        f"Output modalities: {model.output_modalities}\n"
+        f"Prompt text token price: {model.prompt_text_token_price}\n"
+        f"Prompt image token price: {model.prompt_image_token_price}\n"
+        f"Cached prompt token price: {model.cached_prompt_token_price}\n"
+        f"Completion text token price: {model.completion_text_token_price}\n"
+        f"Search price: {model.search_price}\n"
+        f"Created: {model.created}\n"
+        f"Max prompt length: {model.max_prompt_length}\n"
+        f"System fingerprint: {model.system_fingerprint}"
+    )
+
+
+def _format_image_generation_model(model: models_pb2.ImageGenerationModel) -> str:
+    """Formats an image generation model as a single block of text."""
+    return (
+        f"Model name: {model.name}\n"
+        f"Aliases: {model.aliases}\n"
+        f"Version: {model.version}\n"
+        f"Input modalities: {model.input_modalities}\n"
+        f"Output modalities: {model.output_modalities}\n"
+        f"Image price: {model.image_price}\n"
+        f"Created: {model.created}\n"
+        f"Max prompt length: {model.max_prompt_length}\n"
+        f"System fingerprint: {model.system_fingerprint}"
+    )
+
+
+def _format_embedding_model(model: models_pb2.EmbeddingModel) -> str:
+    """Formats an embedding model as a single block of text."""
+    return (
+        f"Model name: {model.name}\n"
+        f"Aliases: {model.aliases}\n"
+        f"Version: {model.version}\n"
+        f"Input modalities: {model.input_modalities}\n"
+        f"Output modalities: {model.output_modalities}\n"
+        f"Prompt text token price: {model.prompt_text_token_price}\n"
+        f"Prompt image token price: {model.prompt_image_token_price}\n"
+        f"Created: {model.created}\n"
+        f"System fingerprint: {model.system_fingerprint}"
+    )
+
+
+def _print_models(models: Sequence[ModelT], format_model: Callable[[ModelT], str]) -> None:
+    """Prints the given models, or a note if there are none."""
+    print("\n".join(format_model(model) for model in models) if models else "No models found.")
+
 
 async def list_language_models(client: AsyncClient) -> None:
     """List all language models associated with the API key used to make the request."""
     language_models = await client.models.list_language_models()
-    for model in language_models:
-        print(f"Model name: {model.name}")
-        print(f"Aliases: {model.aliases}")
-        print(f"Version: {model.version}")
-        print(f"Input modalities: {model.input_modalities}")
-        print(f"Output modalities: {model.output_modalities}")
-        print(f"Prompt text token price: {model.prompt_text_token_price}")
-        print(f"Prompt image token price: {model.prompt_image_token_price}")
-        print(f"Cached prompt token price: {model.cached_prompt_token_price}")
-        print(f"Completion text token price: {model.completion_text_token_price}")
-        print(f"Search price: {model.search_price}")
-        print(f"Created: {model.created}")
-        print(f"Max prompt length: {model.max_prompt_length}")
-        print(f"System fingerprint: {model.system_fingerprint}")
+    _print_models(language_models, _format_language_model)
 
 
 async def list_image_generation_models(client: AsyncClient) -> None:
     """List all image generation models associated with the API key used to make the request."""
     image_models = await client.models.list_image_generation_models()
-    for model in image_models:
-        print(f"Model name: {model.name}")
-        print(f"Aliases: {model.aliases}")
-        print(f"Version: {model.version}")
-        print(f"Input modalities: {model.input_modalities}")
-        print(f"Output modalities: {model.output_modalities}")
-        print(f"Image price: {model.image_price}")
-        print(f"Created: {model.created}")
-        print(f"Max prompt length: {model.max_prompt_length}")
-        print(f"System fingerprint: {model.system_fingerprint}")
+    _print_models(image_models, _format_image_generation_model)
 
 
 async def list_embedding_models(client: AsyncClient) -> None:
     """List all embedding models associated with the API key used to make the request."""
     embedding_models = await client.models.list_embedding_models()
-    for model in embedding_models:
-        print(f"Model name: {model.name}")
-        print(f"Aliases: {model.aliases}")
-        print(f"Version: {model.version}")
-        print(f"Input modalities: {model.input_modalities}")
-        print(f"Output modalities: {model.output_modalities}")
-        print(f"Prompt text token price: {model.prompt_text_token_price}")
-        print(f"Prompt image token price: {model.prompt_image_token_price}")
-        print(f"Created: {model.created}")
-        print(f"System fingerprint: {model.system_fingerprint}")
+    _print_models(embedding_models, _format_embedding_model)
+
+
+async def list_all_models(client: AsyncClient) -> None:
+    """List all models of every type associated with the API key used to make the request."""
+    # The three requests are independent, so they are sent concurrently over the same channel.
+    language_models, embedding_models, image_models = await asyncio.gather(
+        client.models.list_language_models(),
+        client.models.list_embedding_models(),
+        client.models.list_image_generation_models(),
+    )
+    print("--------- Language models ---------")
+    _print_models(language_models, _format_language_model)
+    print("\n--------- Embedding models ---------")
+    _print_models(embedding_models, _format_embedding_model)
+    print("\n--------- Image generation models ---------")
+    _print_models(image_models, _format_image_generation_model)
 
 
 async def get_language_model(client: AsyncClient, model_name: str) -> None:
     """Get a specific language model by its name"""
     language_model = await client.models.get_language_model(model_name)
-    print(f"Model name: {language_model.name}")
-    print(f"Aliases: {language_model.aliases}")
-    print(f"Version: {language_model.version}")
-    print(f"Input modalities: {language_model.input_modalities}")
-    print(f"Output modalities: {language_model.output_modalities}")
-    print(f"Prompt text token price: {language_model.prompt_text_token_price}")
-    print(f"Prompt image token price: {language_model.prompt_image_token_price}")
-    print(f"Cached prompt token price: {language_model.cached_prompt_token_price}")
-    print(f"Completion text token price: {language_model.completion_text_token_price}")
-    print(f"Search price: {language_model.search_price}")
-    print(f"Created: {language_model.created}")
-    print(f"Max prompt length: {language_model.max_prompt_length}")
-    print(f"System fingerprint: {language_model.system_fingerprint}")
+    print(_format_language_model(language_model))
 
 
 async def get_embedding_model(client: AsyncClient, model_name: str) -> None:
     """Get a specific embedding model by its name."""
     embedding_model = await client.models.get_embedding_model(model_name)
-    print(f"Model name: {embedding_model.name}")
-    print(f"Aliases: {embedding_model.aliases}")
-    print(f"Version: {embedding_model.version}")
-    print(f"Output modalities: {embedding_model.output_modalities}")
-    print(f"Prompt text token price: {embedding_model.prompt_text_token_price}")
-    print(f"Prompt image token price: {embedding_model.prompt_image_token_price}")
-    print(f"Created: {embedding_model.created}")
-    print(f"System fingerprint: {embedding_model.system_fingerprint}")
+    print(_format_embedding_model(embedding_model))
 
 
 async def get_image_generation_model(client: AsyncClient, model_name: str) -> None:
     """Get a specific image generation model by its name."""
     image_generation_model = await client.models.get_image_generation_model(model_name)
-    print(f"Model name: {image_generation_model.name}")
-    print(f"Aliases: {image_generation_model.aliases}")
-    print(f"Version: {image_generation_model.version}")
-    print(f"Output modalities: {image_generation_model.output_modalities}")
-    print(f"Image price: {image_generation_model.image_price}")
-    print(f"Created: {image_generation_model.created}")
-    print(f"Max prompt length: {image_generation_model.max_prompt_length}")
-    print(f"System fingerprint: {image_generation_model.system_fingerprint}")
+    print(_format_image_generation_model(image_generation_model))
 
 
 async def main(argv: Sequence[str]) -> None:
     if len(argv) > 1:
         raise app.UsageError("Unexpected command line arguments.")
 
-    client = AsyncClient()
-
-    match (OPERATION.value, MODEL_TYPE.value, MODEL_NAME.value):
-        case ("list", "language", None):
-            await list_language_models(client)
-        case ("list", "embedding", None):
-            await list_embedding_models(client)
-        case ("list", "image", None):
-            await list_image_generation_models(client)
-        case ("get", "language", model_name):
-            await get_language_model(client, model_name)  # type: ignore
-        case ("get", "embedding", model_name):
-            await get_embedding_model(client, model_name)  # type: ignore
-        case ("get", "image", model_name):
-            await get_image_generation_model(client, model_name)  # type: ignore
-        case _:
-            raise app.UsageError("Unexpected command line arguments.")
+    async with AsyncClient() as client:
+        match (OPERATION.value, MODEL_TYPE.value, MODEL_NAME.value):
+            case ("list", "language", None):
+                await list_language_models(client)
+            case ("list", "embedding", None):
+                await list_embedding_models(client)
+            case ("list", "image", None):
+                await list_image_generation_models(client)
+            case ("list", "all" | None, None):
+                await list_all_models(client)
+            case ("get", "language", str(model_name)):
+                await get_language_model(client, model_name)
+            case ("get", "embedding", str(model_name)):
+                await get_embedding_model(client, model_name)
+            case ("get", "image", str(model_name)):
+                await get_image_generation_model(client, model_name)
+            case _:
+                raise app.UsageError("Unexpected command line arguments.")
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
 import asyncio
+import sys
+import time
 from typing import Sequence
 
 from absl import app, flags
@@ -8,6 +10,9 @@ from xai_sdk.chat import user
 
 STREAM = flags.DEFINE_bool("stream", False, "Whether streaming is enabled.")
 
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
 
 async def reasoning(client: AsyncClient) -> None:
     """Sample from a reasoning model."""
@@ -15,7 +20,7 @@ async def reasoning(client: AsyncClient) -> None:
         model="grok-4.20",  # This model is a reasoning model.
     )
 
-    prompt = input("Enter a prompt: ")
+    prompt = await asyncio.to_thread(input, "Enter a prompt: ")
     chat.append(user(prompt))
 
     response = await chat.sample()
@@ -34,23 +39,31 @@ async def reasoning_with_streaming(client: AsyncClient) -> None:
         model="grok-4.20",  # This model is a reasoning model.
     )
 
-    prompt = input("Enter a prompt: ")
+    prompt = await asyncio.to_thread(input, "Enter a prompt: ")
     chat.append(user(prompt))
 
     print("\n\n--------- Reasoning ---------", flush=True)
     first_content = True
 
     latest_response = None
+    last_flush = time.monotonic()
     async for response, chunk in chat.stream():
-        if chunk.reasoning_content:
-            print(chunk.reasoning_content, end="", flush=True)
-        if chunk.content:
+        # `Chunk` properties are recomputed on every access, so each is read once per chunk.
+        reasoning_content = chunk.reasoning_content
+        content = chunk.content
+        if reasoning_content:
+            sys.stdout.write(reasoning_content)
+        if content:
             if first_content:
                 print("\n\n--------- Final Response ---------", flush=True)
                 first_content = False
-            print(chunk.content, end="", flush=True)
+            sys.stdout.write(content)
 
         latest_response = response
+        if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+            sys.stdout.flush()
+            last_flush = time.monotonic()
+    sys.stdout.flush()
 
     assert latest_response is not None
     print("\n\n--------- Usage ---------")
@@ -63,11 +76,17 @@ async def main(argv: Sequence[str]) -> None:
     if len(argv) > 1:
         raise app.UsageError("Unexpected command line arguments.")
 
-    client = AsyncClient()
-    if STREAM.value:
-        await reasoning_with_streaming(client)
-    else:
-        await reasoning(client)
+    async with AsyncClient() as client:
+        # Connect in the background while the user types the prompt, so that the request doesn't also pay for the
+        # connection handshake.
+        connecting = asyncio.create_task(client.connect())
+        try:
+            if STREAM.value:
+                await reasoning_with_streaming(client)
+            else:
+                await reasoning(client)
+        finally:
+            connecting.cancel()
 
 
 if __name__ == "__main__":
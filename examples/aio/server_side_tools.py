@@ -1,10 +1,37 @@
 import asyncio
 import json
+import sys
+import time
 
 from xai_sdk import AsyncClient
 from xai_sdk.chat import tool, tool_result, user
 from xai_sdk.tools import code_execution, get_tool_call_type, web_search, x_search
 
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
+
+def get_weather(city: str) -> str:
+    """Get the weather for a given city."""
+    return f"The weather in {city} is sunny."
+
+
+# The client-side tool definition is the same for every request, so it is built once.
+WEATHER_TOOL = tool(
+    name="get_weather",
+    description="Get the weather for a given city.",
+    parameters={
+        "type": "object",
+        "properties": {
+            "city": {
+                "type": "string",
+                "description": "The name of the city",
+            }
+        },
+        "required": ["city"],
+    },
+)
+
 
 async def agentic_search(client: AsyncClient, model: str, query: str) -> None:
     chat = client.chat.create(
@@ -25,23 +52,32 @@ async def agentic_search(client: AsyncClient, model: str, query: str) -> None:
     chat.append(user(query))
 
     is_thinking = True
+    last_flush = time.monotonic()
     async for response, chunk in chat.stream():
-        for tool_call in chunk.tool_calls:
+        # `Chunk` properties are recomputed on every access, so each is read once per chunk.
+        tool_calls = chunk.tool_calls
+        tool_outputs = chunk.tool_outputs
+        content = chunk.content
+        for tool_call in tool_calls:
             print(f"\nCalling tool: {tool_call.function.name} with arguments: {tool_call.function.arguments}")
-        for tool_output in chunk.tool_outputs:
+        for tool_output in tool_outputs:
             if tool_output.content:
                 tool_call = tool_output.tool_calls[0]
                 print(
                     f"\nTool call {tool_call.function.name}({tool_call.function.arguments}) "
                     f"outputs: {tool_output.content}"
                 )
-        if response.usage.reasoning_tokens and is_thinking:
+        if is_thinking and response.usage.reasoning_tokens:
             print(f"\rThinking... ({response.usage.reasoning_tokens} tokens)", end="", flush=True)
-        if chunk.content and is_thinking:
-            print("\n\nFinal Response:")
-            is_thinking = False
-        if chunk.content and not is_thinking:
-            print(chunk.content, end="", flush=True)
+        if content:
+            if is_thinking:
+                print("\n\nFinal Response:")
+                is_thinking = False
+            sys.stdout.write(content)
+        if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+            sys.stdout.flush()
+            last_flush = time.monotonic()
+    sys.stdout.flush()
 
     print("\n\nCitations:")
     print(response.citations)
@@ -59,28 +95,9 @@ async def agentic_search(client: AsyncClient, model: str, query: str) -> None:
 
 
 async def agentic_tools_with_client_side_tools_encrypted_content(client: AsyncClient, model: str) -> None:
-    def get_weather(city: str) -> str:
-        """Get the weather for a given city."""
-        return f"The weather in {city} is sunny."
-
-    weather_tool = tool(
-        name="get_weather",
-        description="Get the weather for a given city.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "city": {
-                    "type": "string",
-                    "description": "The name of the city",
-                }
-            },
-            "required": ["city"],
-        },
-    )
-
     chat = client.chat.create(
         model=model,
-        tools=[web_search(), weather_tool],
+        tools=[web_search(), WEATHER_TOOL],
         use_encrypted_content=True,
     )
     chat.append(user("What is the weather in the city of the team that won the 2025 NBA championship?"))
@@ -117,28 +134,11 @@ async def agentic_tools_with_client_side_tools_encrypted_content(client: AsyncCl
 
 
 async def agentic_tools_with_client_side_tools_previous_response_id(client: AsyncClient, model: str) -> None:
-    def get_weather(city: str) -> str:
-        """Get the weather for a given city."""
-        return f"The weather in {city} is sunny."
-
-    weather_tool = tool(
-        name="get_weather",
-        description="Get the weather for a given city.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "city": {
-                    "type": "string",
-                    "description": "The name of the city",
-                }
-            },
-            "required": ["city"],
-        },
-    )
-
+    # The tools are the same for every request in the conversation, so they are only built once.
+    tools = [web_search(), WEATHER_TOOL]
     chat = client.chat.create(
         model=model,
-        tools=[web_search(), weather_tool],
+        tools=tools,
         store_messages=True,
     )
     chat.append(user("What is the weather in the city of the team that won the 2025 NBA championship?"))
@@ -168,7 +168,7 @@ async def agentic_tools_with_client_side_tools_previous_response_id(client: Asyn
 
         chat = client.chat.create(
             model=model,
-            tools=[web_search(), weather_tool],
+            tools=tools,
             previous_response_id=response.id,
             store_messages=True,
         )
@@ -184,42 +184,42 @@ async def agentic_tools_with_client_side_tools_previous_response_id(client: Asyn
 
 
 async def main() -> None:
-    client = AsyncClient()
-
-    # Trigger web/x search
-    await agentic_search(
-        client,
-        model="grok-4.20",
-        query=(
-            "What was the result of Arsenal's most recent game? Where did they play, who scored and in which minutes?"
-        ),
-    )
+    async with AsyncClient() as client:
+        # Trigger web/x search
+        await agentic_search(
+            client,
+            model="grok-4.20",
+            query=(
+                "What was the result of Arsenal's most recent game? "
+                "Where did they play, who scored and in which minutes?"
+            ),
+        )
 
-    # Trigger code execution
-    # await agentic_search(
-    #     client,
-    #     model="grok-4.20",
-    #     query=("What is the 102nd number in the Fibonacci sequence?. show me the code"),
-    # )
-
-    # Trigger x search/web search
-    # await agentic_search(
-    #     client,
-    #     model="grok-4.20",
-    #     query="What can you tell me about the X user 0xPromar and his recent activity?",
-    # )
-
-    # Trigger agentic tools with client-side tools using encrypted content
-    # await agentic_tools_with_client_side_tools_encrypted_content(
-    #     client,
-    #     model="grok-4.20",
-    # )
-
-    # Trigger agentic tools with client-side tools using previous response id
-    # await agentic_tools_with_client_side_tools_previous_response_id(
-    #     client,
-    #     model="grok-4.20",
-    # )
+        # Trigger code execution
+        # await agentic_search(
+        #     client,
+        #     model="grok-4.20",
+        #     query=("What is the 102nd number in the Fibonacci sequence?. show me the code"),
+        # )
+
+        # Trigger x search/web search
+        # await agentic_search(
+        #     client,
+        #     model="grok-4.20",
+        #     query="What can you tell me about the X user 0xPromar and his recent activity?",
+        # )
+
+        # Trigger agentic tools with client-side tools using encrypted content
+        # await agentic_tools_with_client_side_tools_encrypted_content(
+        #     client,
+        #     model="grok-4.20",
+        # )
+
+        # Trigger agentic tools with client-side tools using previous response id
+        # await agentic_tools_with_client_side_tools_previous_response_id(
+        #     client,
+        #     model="grok-4.20",
+        # )
 
 
 if __name__ == "__main__":
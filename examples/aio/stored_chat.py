@@ -17,27 +17,28 @@ async def stored_response(client: AsyncClient):
     print(original_response.content)
 
     # Start a new chat with the previous response as the previous_response_id
-    chat = client.chat.create(
+    thread_one = client.chat.create(
         model="grok-4.20-non-reasoning",
         previous_response_id=original_response.id,
         store_messages=True,
     )
     # Purposefully ask a question that requires the previous context in order to answer.
-    chat.append(user("Who was the founder?"))
-    follow_up_response = await chat.sample()
-
-    print("\n----------------- Thread one -----------------")
-    print(follow_up_response.content)
+    thread_one.append(user("Who was the founder?"))
 
     # Optionally, easily create a new thread of conversation using the original chat as a starting point.
-    chat = client.chat.create(
+    thread_two = client.chat.create(
         model="grok-4.20-non-reasoning",
         previous_response_id=original_response.id,
         store_messages=True,
     )
-    chat.append(user("What is the company's mission?"))
+    thread_two.append(user("What is the company's mission?"))
+
+    # Both threads only depend on the original response, so they can be sampled concurrently.
+    follow_up_response, final_response = await asyncio.gather(thread_one.sample(), thread_two.sample())
+
+    print("\n----------------- Thread one -----------------")
+    print(follow_up_response.content)
 
-    final_response = await chat.sample()
     print("\n----------------- Thread two -----------------")
     print(final_response.content)
 
@@ -60,11 +61,12 @@ async def get_stored_response_batch(client: AsyncClient):
     chat.append(system("You give brief answers"))
     chat.append(user("Tell me about xAI"))
 
+    # A single request returns all 3 completions, which share the same response ID.
     original_responses = await chat.sample_batch(3)
     for index, response in enumerate(original_responses):
         print(f"\nOriginal response {index}: {response.content}")
 
-    retrieved_responses = await client.chat.get_stored_completion(response.id)
+    retrieved_responses = await client.chat.get_stored_completion(original_responses[0].id)
     for index, response in enumerate(retrieved_responses):
         print(f"\nRetrieved response {index}: {response.content}")
 
@@ -91,13 +93,12 @@ async def delete_stored_response(client: AsyncClient):
 
 
 async def main():
-    client = AsyncClient()
-
-    # Uncomment the respective line to run the example.
-    await stored_response(client)
-    # await get_stored_response(client)
-    # await get_stored_response_batch(client)
-    # await delete_stored_response(client)
+    async with AsyncClient() as client:
+        # Uncomment the respective line to run the example.
+        await stored_response(client)
+        # await get_stored_response(client)
+        # await get_stored_response_batch(client)
+        # await delete_stored_response(client)
 
 
 if __name__ == "__main__":
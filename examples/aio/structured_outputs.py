@@ -1,27 +1,34 @@
 import asyncio
+import json
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from xai_sdk import AsyncClient
 from xai_sdk.chat import image, system, user
 
 
-async def structured_output(client: AsyncClient) -> None:
-    """Extract structured information from an image."""
+# Define the desired shape of the output as Pydantic models. They are defined once at module scope so that pydantic
+# only builds their validators once, rather than on every call.
+class Item(BaseModel):
+    name: str
+    quantity: int
+    price_in_cents: int
+
+
+class Receipt(BaseModel):
+    date: datetime
+    items: list[Item]
+    currency: str
+    total_in_cents: int
+
 
-    # Define the desired shape of the output as a Pydantic model.
-    class Item(BaseModel):
-        name: str
-        quantity: int
-        price_in_cents: int
+# Built once at import time and reused to validate raw JSON content against `Receipt`.
+_RECEIPT_ADAPTER = TypeAdapter(Receipt)
 
-    class Receipt(BaseModel):
-        date: datetime
-        items: list[Item]
-        currency: str
-        total_in_cents: int
 
+async def structured_output(client: AsyncClient) -> None:
+    """Extract structured information from an image."""
     chat = client.chat.create(
         model="grok-4.20",
         messages=[
@@ -55,17 +62,6 @@ async def structured_output(client: AsyncClient) -> None:
 async def alternate_structured_output(client: AsyncClient) -> None:
     """Extract structured information from an image using a Pydantic model."""
 
-    class Item(BaseModel):
-        name: str
-        quantity: int
-        price_in_cents: int
-
-    class Receipt(BaseModel):
-        date: datetime
-        items: list[Item]
-        currency: str
-        total_in_cents: int
-
     # Alternatively, you can pass the Pydantic model directly to the
     # response_format parameter of the chat.create method.
     chat = client.chat.create(
@@ -89,7 +85,7 @@ async def alternate_structured_output(client: AsyncClient) -> None:
     response = await chat.sample()
     print(response.content, end="\n\n")
 
-    receipt = Receipt.model_validate_json(response.content)
+    receipt = _RECEIPT_ADAPTER.validate_json(response.content)
     assert isinstance(receipt, Receipt)
 
     for item in receipt.items:
@@ -98,10 +94,46 @@ async def alternate_structured_output(client: AsyncClient) -> None:
     print(f"Total: {receipt.total_in_cents / 100} {receipt.currency}")
 
 
+async def raw_structured_output(client: AsyncClient) -> None:
+    """Extract structured information from an image and print it without building Pydantic models."""
+    chat = client.chat.create(
+        model="grok-4.20",
+        response_format=Receipt,
+        messages=[
+            system("You are an expert at extracting information from receipts. You pay great attention to detail."),
+        ],
+    )
+
+    chat.append(
+        user(
+            "Extract the information contained in this receipt.",
+            image(
+                "https://images.pexels.com/photos/13431759/pexels-photo-13431759.jpeg?auto=compress&cs=tinysrgb&w=1260&h=750&dpr=2",
+                detail="high",
+            ),
+        )
+    )
+
+    response = await chat.sample()
+
+    # When the receipt is only printed, reading the fields straight from the parsed JSON avoids creating the
+    # `Receipt` and `Item` objects altogether. Nothing is validated, so use this only where that's acceptable.
+    receipt = json.loads(response.content)
+    currency = receipt["currency"]
+    for item in receipt["items"]:
+        print(f"{item['quantity']}x {item['name']} - {item['price_in_cents'] / 100} {currency}")
+
+    print(f"Total: {receipt['total_in_cents'] / 100} {currency}")
+
+
 async def main() -> None:
-    client = AsyncClient()
-    await structured_output(client)
-    # await alternate_structured_output(client)
+    async with AsyncClient() as client:
+        # The examples are independent of each other, so they run concurrently.
+        await asyncio.gather(
+            structured_output(client),
+            alternate_structured_output(client),
+            raw_structured_output(client),
+        )
 
 
 if __name__ == "__main__":
@@ -24,7 +24,9 @@ async def console_export_example(client: AsyncClient):
     Export traces to console for debugging and development.
     """
     telemetry = Telemetry()
-    telemetry.setup_console_exporter()
+    # Spans are printed in batches from a background thread so that exporting them doesn't slow down the requests.
+    # Pending spans are flushed when the process exits.
+    telemetry.setup_console_exporter(batch=True)
 
     chat = client.chat.create(model="grok-4.20-non-reasoning")
     chat.append(user("Hello, how are you?"))
@@ -68,21 +70,20 @@ async def custom_tracer_provider_example(client: AsyncClient):
 
 
 async def main():
-    client = AsyncClient()
+    async with AsyncClient() as client:
+        # Uncomment the example you want to run:
 
-    # Uncomment the example you want to run:
+        # No telemetry (baseline)
+        # await no_telemetry_example(client)
 
-    # No telemetry (baseline)
-    # await no_telemetry_example(client)
+        # Console export (for debugging)
+        await console_export_example(client)
 
-    # Console export (for debugging)
-    await console_export_example(client)
+        # OTLP export (make sure you have the relevant environment variables set)
+        # await otlp_export_example(client)
 
-    # OTLP export (make sure you have the relevant environment variables set)
-    # await otlp_export_example(client)
-
-    # Custom tracer provider
-    # await custom_tracer_provider_example(client)
+        # Custom tracer provider
+        # await custom_tracer_provider_example(client)
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ from xai_sdk import AsyncClient
 
 
 async def tokenize_text(client: AsyncClient):
-    prompt = input("Enter a prompt: ")
+    prompt = await asyncio.to_thread(input, "Enter a prompt: ")
     tokens = await client.tokenize.tokenize_text(prompt, model="grok-4.20-non-reasoning")
     for token in tokens:
         print(f"Token ID: {token.token_id}")
@@ -13,8 +13,8 @@ async def tokenize_text(client: AsyncClient):
 
 
 async def main():
-    client = AsyncClient()
-    await tokenize_text(client)
+    async with AsyncClient() as client:
+        await tokenize_text(client)
 
 
 if __name__ == "__main__":
@@ -24,43 +24,42 @@ async def main(argv: Sequence[str]) -> None:
     if not VIDEO_URL.value:
         raise app.UsageError("--video-url is required.")
 
-    client = xai_sdk.AsyncClient()
+    async with xai_sdk.AsyncClient() as client:
+        duration = DURATION.value or None
+        video_url = VIDEO_URL.value
 
-    duration = DURATION.value or None
-    video_url = VIDEO_URL.value
+        while True:
+            prompt = await asyncio.to_thread(input, "Extension prompt (blank to stop): ")
+            if not prompt:
+                return
 
-    while True:
-        prompt = input("Extension prompt (blank to stop): ")
-        if not prompt:
-            return
+            try:
+                response = await client.video.extend(
+                    prompt=prompt,
+                    model=MODEL.value,
+                    video_url=video_url,
+                    duration=duration,
+                    timeout=timedelta(seconds=TIMEOUT.value),
+                    interval=timedelta(seconds=INTERVAL.value),
+                )
+                print(f"Respects moderation: {response.respect_moderation}")
+                if response.respect_moderation:
+                    print(f"Video URL: {response.url}")
+                    print(f"Duration: {response.duration}s")
+                else:
+                    print("Video URL not returned due to moderation.")
+                if response.cost_usd is not None:
+                    print(f"Cost in USD: ${response.cost_usd:.4f}")
 
-        try:
-            response = await client.video.extend(
-                prompt=prompt,
-                model=MODEL.value,
-                video_url=video_url,
-                duration=duration,
-                timeout=timedelta(seconds=TIMEOUT.value),
-                interval=timedelta(seconds=INTERVAL.value),
-            )
-            print(f"Respects moderation: {response.respect_moderation}")
-            if response.respect_moderation:
-                print(f"Video URL: {response.url}")
-                print(f"Duration: {response.duration}s")
-            else:
-                print("Video URL not returned due to moderation.")
-            if response.cost_usd is not None:
-                print(f"Cost in USD: ${response.cost_usd:.4f}")
-
-            # Chain extensions: use the returned URL as the next input video.
-            if response.respect_moderation:
-                video_url = response.url
-        except RuntimeError as e:
-            # request expired
-            print(e)
-        except ValueError as e:
-            # video URL missing from response
-            print(e)
+                # Chain extensions: use the returned URL as the next input video.
+                if response.respect_moderation:
+                    video_url = response.url
+            except RuntimeError as e:
+                # request expired
+                print(e)
+            except ValueError as e:
+                # video URL missing from response
+                print(e)
 
 
 if __name__ == "__main__":
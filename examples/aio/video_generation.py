@@ -38,55 +38,56 @@ async def main(argv: Sequence[str]) -> None:
     if len(argv) > 1:
         raise app.UsageError("Unexpected command line arguments.")
 
-    client = xai_sdk.AsyncClient()
+    async with xai_sdk.AsyncClient() as client:
+        duration = DURATION.value or None
+        image_url = IMAGE_URL.value or None
+        video_url = VIDEO_URL.value or None
+        aspect_ratio = cast(VideoAspectRatio, ASPECT_RATIO.value) if ASPECT_RATIO.value else None
+        resolution = cast(VideoResolution, RESOLUTION.value) if RESOLUTION.value else None
+        reference_image_urls = REFERENCE_IMAGE_URLS.value or None
 
-    duration = DURATION.value or None
-    image_url = IMAGE_URL.value or None
-    video_url = VIDEO_URL.value or None
-    aspect_ratio = cast(VideoAspectRatio, ASPECT_RATIO.value) if ASPECT_RATIO.value else None
-    resolution = cast(VideoResolution, RESOLUTION.value) if RESOLUTION.value else None
-    reference_image_urls = REFERENCE_IMAGE_URLS.value or None
+        previous_video_url: str | None = video_url
+        first_turn = True
 
-    previous_video_url: str | None = video_url
-    first_turn = True
-
-    while True:
-        prompt = input("Prompt (blank to stop): " if first_turn else "Edit prompt (blank to stop): ")
-        if not prompt:
-            return
-
-        try:
-            response = await client.video.generate(
-                prompt=prompt,
-                model=MODEL.value,
-                image_url=image_url if first_turn else None,
-                video_url=previous_video_url,
-                duration=duration,
-                aspect_ratio=aspect_ratio,
-                resolution=resolution,
-                reference_image_urls=reference_image_urls if first_turn else None,
-                timeout=timedelta(seconds=TIMEOUT.value),
-                interval=timedelta(seconds=INTERVAL.value),
+        while True:
+            prompt = await asyncio.to_thread(
+                input, "Prompt (blank to stop): " if first_turn else "Edit prompt (blank to stop): "
             )
-            print(f"Respects moderation: {response.respect_moderation}")
-            if response.respect_moderation:
-                print(f"Video URL: {response.url}")
-                print(f"Duration: {response.duration}s")
-            else:
-                print("Video URL not returned due to moderation.")
-            if response.cost_usd is not None:
-                print(f"Cost in USD: ${response.cost_usd:.4f}")
+            if not prompt:
+                return
+
+            try:
+                response = await client.video.generate(
+                    prompt=prompt,
+                    model=MODEL.value,
+                    image_url=image_url if first_turn else None,
+                    video_url=previous_video_url,
+                    duration=duration,
+                    aspect_ratio=aspect_ratio,
+                    resolution=resolution,
+                    reference_image_urls=reference_image_urls if first_turn else None,
+                    timeout=timedelta(seconds=TIMEOUT.value),
+                    interval=timedelta(seconds=INTERVAL.value),
+                )
+                print(f"Respects moderation: {response.respect_moderation}")
+                if response.respect_moderation:
+                    print(f"Video URL: {response.url}")
+                    print(f"Duration: {response.duration}s")
+                else:
+                    print("Video URL not returned due to moderation.")
+                if response.cost_usd is not None:
+                    print(f"Cost in USD: ${response.cost_usd:.4f}")
 
-            # Chain edits: use the returned URL as the next input video.
-            if response.respect_moderation:
-                previous_video_url = response.url
-                first_turn = False
-        except RuntimeError as e:
-            # request expired
-            print(e)
-        except ValueError as e:
-            # video URL missing from response
-            print(e)
+                # Chain edits: use the returned URL as the next input video.
+                if response.respect_moderation:
+                    previous_video_url = response.url
+                    first_turn = False
+            except RuntimeError as e:
+                # request expired
+                print(e)
+            except ValueError as e:
+                # video URL missing from response
+                print(e)
 
 
 if __name__ == "__main__":
@@ -4,19 +4,21 @@ from xai_sdk import Client
 def get_api_key_info(client: Client) -> None:
     """Get the information regarding your API key."""
     api_key_info = client.auth.get_api_key_info()
-    print("--- API key info ---")
-    print(f"redacted_api_key: {api_key_info.redacted_api_key}")
-    print(f"user_id: {api_key_info.user_id}")
-    print(f"name: {api_key_info.name}")
-    print(f"create_time: {api_key_info.create_time}")
-    print(f"modify_time: {api_key_info.modify_time}")
-    print(f"modified_by: {api_key_info.modified_by}")
-    print(f"team_id: {api_key_info.team_id}")
-    print(f"acls: {api_key_info.acls}")
-    print(f"api_key_id: {api_key_info.api_key_id}")
-    print(f"api_key_blocked: {api_key_info.api_key_blocked}")
-    print(f"team_blocked: {api_key_info.team_blocked}")
-    print(f"disabled: {api_key_info.disabled}")
+    print(
+        "--- API key info ---\n"
+        f"redacted_api_key: {api_key_info.redacted_api_key}\n"
+        f"user_id: {api_key_info.user_id}\n"
+        f"name: {api_key_info.name}\n"
+        f"create_time: {api_key_info.create_time}\n"
+        f"modify_time: {api_key_info.modify_time}\n"
+        f"modified_by: {api_key_info.modified_by}\n"
+        f"team_id: {api_key_info.team_id}\n"
+        f"acls: {api_key_info.acls}\n"
+        f"api_key_id: {api_key_info.api_key_id}\n"
+        f"api_key_blocked: {api_key_info.api_key_blocked}\n"
+        f"team_blocked: {api_key_info.team_blocked}\n"
+        f"disabled: {api_key_info.disabled}"
+    )
 
 
 def main() -> None:
@@ -3,6 +3,14 @@ import time
 from xai_sdk import Client
 from xai_sdk.chat import image, user
 
+# Polling starts short so small batches are picked up quickly, and backs off while no progress is made.
+MIN_POLL_INTERVAL_SECONDS = 0.25
+MAX_POLL_INTERVAL_SECONDS = 5.0
+POLL_BACKOFF_FACTOR = 1.25
+
+SEPARATOR = "---" * 20
+SHORT_SEPARATOR = "---" * 10
+
 
 def main():
     client = Client()
@@ -10,7 +18,7 @@ def main():
     # Create a new batch
     batch = client.batch.create(batch_name="my_batch")
     print("Created new batch")
-    print("---" * 20)
+    print(SEPARATOR)
     print(batch)
 
     # Compose the chat requests
@@ -43,16 +51,27 @@ def main():
 
     # Wait for batch to complete by polling for completion
     print("Waiting for batch to complete...")
+    interval = MIN_POLL_INTERVAL_SECONDS
+    num_completed = 0
     while True:
         batch = client.batch.get(batch_id=batch.batch_id)
-        print(f"Progress: {batch.state.num_success + batch.state.num_error}/{batch.state.num_requests}")
-        if batch.state.num_pending == 0:
+        # Only report the progress counters while polling; the full batch is printed once it has completed.
+        state = batch.state
+        completed = state.num_success + state.num_error
+        print(f"Progress: {completed}/{state.num_requests}")
+        if state.num_pending == 0:
             break
-        time.sleep(3)
+        if completed > num_completed:
+            # Progress was made since the last poll, check back soon.
+            num_completed = completed
+            interval = MIN_POLL_INTERVAL_SECONDS
+        else:
+            interval = min(interval * POLL_BACKOFF_FACTOR, MAX_POLL_INTERVAL_SECONDS)
+        time.sleep(interval)
 
     # Display final batch status
     print("\nFinal batch status")
-    print("---" * 10)
+    print(SHORT_SEPARATOR)
     print(batch)
 
     # Display cost (ticks are in units of 1e-10 USD)
@@ -61,30 +80,18 @@ def main():
     # List the individual requests of a batch
     metadata = client.batch.list_batch_requests(batch_id=batch.batch_id)
     print("Listing Batch Requests")
-    print("---" * 20)
+    print(SEPARATOR)
     print(metadata)
 
-    # List the results of a batch
-    batch_results = client.batch.list_batch_results(batch_id=batch.batch_id)
-    # Filter the results into succeeded and failed
-    succeeded = batch_results.succeeded
-    failed = batch_results.failed
+    # Stream the results of a batch. Results are printed as soon as their page has been fetched.
     print("Listing batch results")
-    print("---" * 20)
-
-    print("Succeeded results:")
-    print("---" * 20)
-    for result in succeeded:
-        print(f"Batch request ID: {result.batch_request_id}")
-        print(f"Response Content: {result.response.content}")
-
-    if len(failed) > 0:
-        print("Failed results:")
-        print("---" * 20)
-
-        for result in failed:
-            print(f"Batch request ID: {result.batch_request_id}")
-            print(f"Error: {result.error_message}")
+    print(SEPARATOR)
+    for result in client.batch.stream_batch_results(batch_id=batch.batch_id):
+        if result.is_success:
+            outcome = f"Response Content: {result.response.content}"
+        else:
+            outcome = f"Error: {result.error_message}"
+        print(f"Batch request ID: {result.batch_request_id}\n{outcome}")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+import sys
+import time
 from typing import Sequence
 
 from absl import app, flags
@@ -8,6 +10,9 @@ from xai_sdk.chat import assistant, system, user
 STREAM = flags.DEFINE_bool("stream", False, "Whether streaming is enabled.")
 N = flags.DEFINE_integer("n", 1, "Number of answers to generate.")
 
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
 
 def basic_chat(chat: xai_sdk.sync.chat.Chat):
     """Multi-turn chat between a user and an assistant."""
@@ -47,9 +52,14 @@ def chat_with_streaming(chat: xai_sdk.sync.chat.Chat):
         # Stream a response from the assistant.
         stream = chat.stream()
         last_response = None
+        last_flush = time.monotonic()
         for response, chunk in stream:
-            print(chunk.content, end="", flush=True)
+            sys.stdout.write(chunk.content)
             last_response = response
+            if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+                sys.stdout.flush()
+                last_flush = time.monotonic()
+        sys.stdout.flush()
         print()
         assert last_response is not None
         chat.append(last_response)
@@ -70,10 +80,18 @@ def batch_chat(chat: xai_sdk.sync.chat.Chat):
         # Append a user turn to the conversation history.
         chat.append(user(prompt))
 
-        # Sample multiple responses concurrently from the assistant.
-        responses = chat.sample_batch(N.value)
-        for index, response in enumerate(responses):
-            print(f"Grok (response {index + 1}): {response.content}")
+        # Sample multiple responses concurrently from the assistant. The responses are streamed so that each one can
+        # be printed as soon as it is finished, instead of all of them waiting for the slowest one.
+        pending = set(range(N.value))
+        responses = None
+        for responses, _ in chat.stream_batch(N.value):
+            for index in sorted(pending):
+                if responses[index].finish_reason != "REASON_INVALID":
+                    print(f"Grok (response {index + 1}): {responses[index].content}")
+                    pending.discard(index)
+        assert responses is not None
+        for index in sorted(pending):
+            print(f"Grok (response {index + 1}): {responses[index].content}")
 
         print(responses[0].content)
         # Only add the first response to the history.
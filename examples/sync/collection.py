@@ -1,3 +1,5 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import xai_sdk
 
 
@@ -72,21 +74,20 @@ def create_collection_with_bytes_chunking(client: xai_sdk.Client):
 
 
 def list_collections(client: xai_sdk.Client):
-    print("\n=== List Collections ===")
-
     response = client.collections.list(
         limit=10,
         order="asc",
         sort_by="name",
     )
 
-    print(f"Found {len(response.collections)} collections (sorted by name):")
+    lines = ["\n=== List Collections ===", f"Found {len(response.collections)} collections (sorted by name):"]
     for collection in response.collections:
-        print(f"  - {collection.collection_name} (ID: {collection.collection_id})")
-        print(f"    Documents: {collection.documents_count}")
+        lines.append(f"  - {collection.collection_name} (ID: {collection.collection_id})")
+        lines.append(f"    Documents: {collection.documents_count}")
 
     if response.pagination_token:
-        print("\nPagination token available for next page")
+        lines.append("\nPagination token available for next page")
+    print("\n".join(lines))
 
 
 def list_collections_with_filter(client: xai_sdk.Client):
@@ -192,8 +193,6 @@ def add_existing_document(client: xai_sdk.Client, collection_id: str, file_id: s
 
 
 def list_documents(client: xai_sdk.Client, collection_id: str):
-    print("\n=== List Documents ===")
-
     response = client.collections.list_documents(
         collection_id,
         limit=10,
@@ -201,14 +200,15 @@ def list_documents(client: xai_sdk.Client, collection_id: str):
         sort_by="age",
     )
 
-    print(f"Found {len(response.documents)} documents:")
+    lines = ["\n=== List Documents ===", f"Found {len(response.documents)} documents:"]
     for doc in response.documents:
-        print(f"  - {doc.file_metadata.name}")
-        print(f"    File ID: {doc.file_metadata.file_id}")
-        print(f"    Size: {doc.file_metadata.size_bytes} bytes")
-        print(f"    Status: {doc.status}")
+        lines.append(f"  - {doc.file_metadata.name}")
+        lines.append(f"    File ID: {doc.file_metadata.file_id}")
+        lines.append(f"    Size: {doc.file_metadata.size_bytes} bytes")
+        lines.append(f"    Status: {doc.status}")
         if doc.fields:
-            print(f"    Fields: {dict(doc.fields)}")
+            lines.append(f"    Fields: {dict(doc.fields)}")
+    print("\n".join(lines))
 
 
 def list_documents_with_filter(client: xai_sdk.Client, collection_id: str):
@@ -310,80 +310,105 @@ def delete_collection(client: xai_sdk.Client, collection_id: str):
     print(f"Deleted collection (ID: {collection_id})")
 
 
-def main() -> None:
-    client = xai_sdk.Client()
-
-    # Create collections with different chunking strategies
-    collection_id = create_collection(client)
-    collection_id_2 = create_collection_with_token_chunking(client)
-    collection_id_3 = create_collection_with_bytes_chunking(client)
-
-    # List collections (with and without filter)
-    list_collections(client)
-    list_collections_with_filter(client)
+def _report_failures(action: str, ids: list[str], futures: list[Future]) -> bool:
+    """Waits for `futures`, prints the calls that raised and returns whether there were any."""
+    failed = False
+    for id_, future in zip(ids, futures, strict=True):
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Failed to {action} {id_}: {e}")
+            failed = True
+    return failed
 
-    # Get collection metadata
-    get_collection(client, collection_id)
 
-    # Update collection (name, chunk config, description, and field definitions)
-    update_collection(client, collection_id)
-
-    # Upload documents
-    file_id = upload_document(
-        client,
-        collection_id,
-        "ml-fundamentals.txt",
-        b"Machine learning is a subset of artificial intelligence that focuses on building "
-        b"systems that can learn from data and improve their performance over time without "
-        b"being explicitly programmed.",
-        fields={"topic": "machine-learning", "level": "beginner"},
-    )
-
-    file_id_2 = upload_document(
-        client,
-        collection_id,
-        "deep-learning.txt",
-        b"Deep learning is a subset of machine learning that uses neural networks with "
-        b"multiple layers. These networks can learn hierarchical representations of data, "
-        b"making them particularly effective for tasks like image recognition and natural "
-        b"language processing.",
-    )
-
-    # Add an existing document to another collection
-    add_existing_document(client, collection_id_2, file_id)
-
-    # List documents (with and without filter)
-    list_documents(client, collection_id)
-    list_documents_with_filter(client, collection_id)
-
-    # Get document metadata
-    get_document(client, collection_id, file_id)
-
-    # Batch get documents
-    batch_get_documents(client, collection_id, [file_id, file_id_2])
-
-    # Update a document
-    update_document(client, collection_id, file_id)
-
-    # Search documents
-    search(client, collection_id)
-
-    # Generate a description from collection contents
-    generate_description(client, collection_id)
-
-    # Reindex document (useful after updating collection configuration)
-    reindex_document(client, collection_id, file_id)
-
-    # Remove documents from collection
-    remove_document(client, collection_id, file_id)
-    remove_document(client, collection_id, file_id_2)
-
-    # Delete collections (cleanup)
-    delete_collection(client, collection_id)
-    delete_collection(client, collection_id_2)
-    delete_collection(client, collection_id_3)
+def main() -> None:
+    client = xai_sdk.Client()
 
-    print("\n=== All examples completed successfully! ===")
+    # The examples form a small dependency graph. Independent steps are submitted to a thread pool together so their
+    # network round trips overlap, and each group is waited on before starting the steps that depend on it.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Create collections with different chunking strategies
+        collection_future = executor.submit(create_collection, client)
+        collection_2_future = executor.submit(create_collection_with_token_chunking, client)
+        collection_3_future = executor.submit(create_collection_with_bytes_chunking, client)
+        collection_id = collection_future.result()
+        collection_id_2 = collection_2_future.result()
+        collection_id_3 = collection_3_future.result()
+
+        # List collections (with and without filter) and get collection metadata
+        for future in [
+            executor.submit(list_collections, client),
+            executor.submit(list_collections_with_filter, client),
+            executor.submit(get_collection, client, collection_id),
+        ]:
+            future.result()
+
+        # Update collection (name, chunk config, description, and field definitions). This happens before the uploads
+        # so the documents are chunked with the updated configuration.
+        update_collection(client, collection_id)
+
+        # Upload documents
+        file_future = executor.submit(
+            upload_document,
+            client,
+            collection_id,
+            "ml-fundamentals.txt",
+            b"Machine learning is a subset of artificial intelligence that focuses on building "
+            b"systems that can learn from data and improve their performance over time without "
+            b"being explicitly programmed.",
+            fields={"topic": "machine-learning", "level": "beginner"},
+        )
+        file_2_future = executor.submit(
+            upload_document,
+            client,
+            collection_id,
+            "deep-learning.txt",
+            b"Deep learning is a subset of machine learning that uses neural networks with "
+            b"multiple layers. These networks can learn hierarchical representations of data, "
+            b"making them particularly effective for tasks like image recognition and natural "
+            b"language processing.",
+        )
+        file_id = file_future.result()
+        file_id_2 = file_2_future.result()
+
+        # Add an existing document to another collection, list documents (with and without filter), get document
+        # metadata, batch get documents and generate a description from the collection contents. None of these modify
+        # the documents in the first collection, so they can run concurrently.
+        for future in [
+            executor.submit(add_existing_document, client, collection_id_2, file_id),
+            executor.submit(list_documents, client, collection_id),
+            executor.submit(list_documents_with_filter, client, collection_id),
+            executor.submit(get_document, client, collection_id, file_id),
+            executor.submit(batch_get_documents, client, collection_id, [file_id, file_id_2]),
+            executor.submit(generate_description, client, collection_id),
+        ]:
+            future.result()
+
+        # Update a document
+        update_document(client, collection_id, file_id)
+
+        # Search documents
+        search(client, collection_id)
+
+        # Reindex the updated document (useful after updating collection configuration)
+        reindex_document(client, collection_id, file_id)
+
+        # Remove documents from collection. Failures are reported rather than raised so that one failed call doesn't
+        # prevent the rest of the cleanup.
+        file_ids = [file_id, file_id_2]
+        futures = [executor.submit(remove_document, client, collection_id, f) for f in file_ids]
+        cleanup_failed = _report_failures("remove document", file_ids, futures)
+
+        # Delete collections (cleanup)
+        collection_ids = [collection_id, collection_id_2, collection_id_3]
+        futures = [executor.submit(delete_collection, client, c) for c in collection_ids]
+        cleanup_failed |= _report_failures("delete collection", collection_ids, futures)
+
+    if cleanup_failed:
+        print("\n=== All examples completed, but some cleanup steps failed ===")
+    else:
+        print("\n=== All examples completed successfully! ===")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+import sys
+import tempfile
+import time
 from concurrent.futures import ThreadPoolExecutor
 
 import requests
@@ -9,25 +12,47 @@ from xai_sdk.tools import collections_search
 TESLA_10_Q_PDF_URL = "https://ir.tesla.com/_flysystem/s3/sec/000162828025045968/tsla-20250930-gen.pdf"
 TESLA_10_K_PDF_URL = "https://ir.tesla.com/_flysystem/s3/sec/000162828025003063/tsla-20241231-gen.pdf"
 
+# The "Thinking..." progress line is redrawn at most this often.
+PROGRESS_INTERVAL_SECONDS = 0.1
 
-def agentic_collections_search(client: Client, model: str) -> None:
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
+
+def agentic_collections_search(client: Client, model: str) -> None:  # noqa: C901
     response = client.collections.create("tesla-sec-filings")
     print(f"Created collection: {response.collection_id}")
 
     def upload_document(url: str, name: str, collection_id: str) -> None:
-        print(f"Uploading {name} document to collection")
-        pdf_content = requests.get(url, timeout=5).content
-        client.collections.upload_document(
-            collection_id=collection_id,
-            name=name,
-            data=pdf_content,
-            wait_for_indexing=True,
-        )
+        # Stream the PDF into a spooled temporary file (kept in memory up to 8 MiB, on disk beyond that) and hand the
+        # file object to the SDK, which uploads it in chunks without buffering the whole body again. The HTTP response
+        # is closed before the upload, so it isn't held open while waiting for the document to be indexed. Each call
+        # to `requests.get` uses its own session, since `requests.Session` isn't documented as thread-safe.
+        with tempfile.SpooledTemporaryFile(max_size=8 << 20) as pdf_file:
+            # The read timeout allows for slow multi-megabyte downloads.
+            with requests.get(url, stream=True, timeout=(5, 60)) as pdf_response:
+                pdf_response.raise_for_status()
+                for chunk in pdf_response.iter_content(65536):
+                    pdf_file.write(chunk)
+            pdf_file.seek(0)
+
+            print(f"Uploading {name} document to collection")
+            client.collections.upload_document(
+                collection_id=collection_id,
+                name=name,
+                data=pdf_file,
+                wait_for_indexing=True,
+            )
         print(f"Uploaded {name} document to collection")
 
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        executor.submit(upload_document, TESLA_10_Q_PDF_URL, "tesla-10-Q-2024.pdf", response.collection_id)
-        executor.submit(upload_document, TESLA_10_K_PDF_URL, "tesla-10-K-2024.pdf", response.collection_id)
+    documents = [
+        (TESLA_10_Q_PDF_URL, "tesla-10-Q-2024.pdf"),
+        (TESLA_10_K_PDF_URL, "tesla-10-K-2024.pdf"),
+    ]
+    with ThreadPoolExecutor(max_workers=len(documents)) as executor:
+        futures = [executor.submit(upload_document, url, name, response.collection_id) for url, name in documents]
+        for future in futures:
+            future.result()
 
     chat = client.chat.create(
         model=model,
@@ -48,17 +73,26 @@ def agentic_collections_search(client: Client, model: str) -> None:
     )
 
     is_thinking = True
+    last_progress = 0.0
+    last_flush = time.monotonic()
     for response, chunk in chat.stream():
         for tool_call in chunk.tool_calls:
             print(f"\nCalling tool: {tool_call.function.name} with arguments: {tool_call.function.arguments}")
         if response.usage.reasoning_tokens and is_thinking:
-            print(f"\rThinking... ({response.usage.reasoning_tokens} tokens)", end="", flush=True)
+            now = time.monotonic()
+            if now - last_progress >= PROGRESS_INTERVAL_SECONDS:
+                print(f"\rThinking... ({response.usage.reasoning_tokens} tokens)", end="", flush=True)
+                last_progress = now
         if chunk.content and is_thinking:
             print("\n\nFinal Response:")
             is_thinking = False
         if chunk.content and not is_thinking:
-            print(chunk.content, end="", flush=True)
+            sys.stdout.write(chunk.content)
         latest_response = response
+        if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+            sys.stdout.flush()
+            last_flush = time.monotonic()
+    sys.stdout.flush()
 
     print("\n\nCitations:")
     print(latest_response.citations)
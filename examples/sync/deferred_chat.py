@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Sequence
+from typing import Optional, Sequence
 
 from absl import app, flags
 
@@ -7,10 +7,20 @@ from xai_sdk import Client
 from xai_sdk.chat import user
 
 TIMEOUT = flags.DEFINE_integer("timeout", 5, "Timeout in minutes for the deferred chat request.")
-INTERVAL = flags.DEFINE_integer("interval", 100, "Interval in milliseconds for the deferred chat request.")
+INTERVAL = flags.DEFINE_integer(
+    "interval",
+    None,
+    "Fixed polling interval in milliseconds for the deferred chat request. If omitted, polling starts at 100ms and "
+    "backs off up to 2s.",
+)
 N = flags.DEFINE_integer("n", 1, "Number of responses to generate.")
 
 
+def _poll_interval() -> Optional[timedelta]:
+    """Returns the fixed polling interval, if one was given. Otherwise the SDK polls with an increasing interval."""
+    return timedelta(milliseconds=INTERVAL.value) if INTERVAL.value is not None else None
+
+
 # see https://docs.x.ai/docs/guides/deferred-chat-completions#deferred-chat-completions
 
 
@@ -20,7 +30,7 @@ def deferred_chat(client: Client):
     chat = client.chat.create(model="grok-4.20-non-reasoning")
     chat.append(user("Hello"))
     try:
-        response = chat.defer(timeout=timedelta(minutes=TIMEOUT.value), interval=timedelta(milliseconds=INTERVAL.value))
+        response = chat.defer(timeout=timedelta(minutes=TIMEOUT.value), interval=_poll_interval())
         print(response.content)
     except RuntimeError as e:
         # request expired
@@ -35,9 +45,7 @@ def batch_deferred_chat(client: Client):
     chat = client.chat.create(model="grok-4.20-non-reasoning")
     chat.append(user("Hello"))
     try:
-        responses = chat.defer_batch(
-            n=N.value, timeout=timedelta(minutes=TIMEOUT.value), interval=timedelta(milliseconds=INTERVAL.value)
-        )
+        responses = chat.defer_batch(n=N.value, timeout=timedelta(minutes=TIMEOUT.value), interval=_poll_interval())
         for response in responses:
             print(response.content)
     except RuntimeError as e:
@@ -3,21 +3,39 @@
 import io
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from tqdm import tqdm
 
 import xai_sdk
 
 
+def _create_sparse_file(file_size: int) -> str:
+    """Create a temporary file of the given size and return its path.
+
+    The file is extended with a single `truncate` call instead of being written out, so on most filesystems it is
+    created sparse and reads back as zeros without any data being written to disk.
+    """
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
+        f.truncate(file_size)
+        return f.name
+
+
+def _write_temp_file(data: bytes, suffix: str) -> str:
+    """Write `data` to a new temporary file and return its path."""
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=suffix, delete=False) as f:
+        f.write(data)
+        return f.name
+
+
 def upload_example(client: xai_sdk.Client):
     """Demonstrate file upload."""
     print("\n=== Upload Example ===")
 
     # Create a temporary file to upload
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write("This is a test file for the Files API.\n")
-        f.write("It demonstrates uploading files to the xAI platform.\n")
-        temp_file_path = f.name
+    temp_file_path = _write_temp_file(
+        b"This is a test file for the Files API.\nIt demonstrates uploading files to the xAI platform.\n", ".txt"
+    )
 
     try:
         # Upload the file
@@ -59,10 +77,7 @@ def upload_file_object_example(client: xai_sdk.Client):
     print(f"File size: {file.size} bytes")
 
     # Example 2: Upload from opened file (filename auto-detected from file.name)
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".dat", delete=False) as f:
-        f.write(b"Data written to temp file for upload via file object.")
-        temp_path = f.name
-
+    temp_path = _write_temp_file(b"Data written to temp file for upload via file object.", ".dat")
     try:
         with open(temp_path, "rb") as f:
             # filename is automatically detected from f.name
@@ -73,6 +88,17 @@ def upload_file_object_example(client: xai_sdk.Client):
     finally:
         os.unlink(temp_path)
 
+    # Example 3: Upload from an in-memory file object with a .name attribute (filename auto-detected from it).
+    # No temporary file is needed: any binary file-like object is streamed the same way as an opened file.
+    file_obj_3 = io.BytesIO(b"Data uploaded via a named file object.")
+    file_obj_3.name = "file_object_example.dat"  # type: ignore[attr-defined]
+
+    # filename is automatically detected from file_obj_3.name
+    file3 = client.files.upload(file_obj_3)
+    print(f"Uploaded from in-memory file object: {file3.filename}")
+    print(f"File ID: {file3.id}")
+    print(f"File size: {file3.size} bytes")
+
     return file.id
 
 
@@ -82,11 +108,7 @@ def upload_large_file_example(client: xai_sdk.Client):
 
     # Create a temporary 48MB file
     file_size = 48 * 1024 * 1024  # 48 MB
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
-        write_chunk_size = 1024 * 1024  # 1 MB write chunks
-        for _ in range(file_size // write_chunk_size):
-            f.write(b"X" * write_chunk_size)
-        temp_file_path = f.name
+    temp_file_path = _create_sparse_file(file_size)
 
     try:
         print(f"Created temporary 48MB file: {temp_file_path}")
@@ -112,11 +134,7 @@ def upload_with_progress_tqdm_example(client: xai_sdk.Client):
 
     # Create a temporary 10MB file
     file_size = 10 * 1024 * 1024  # 10 MB
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
-        write_chunk_size = 1024 * 1024  # 1 MB write chunks
-        for _ in range(file_size // write_chunk_size):
-            f.write(b"X" * write_chunk_size)
-        temp_file_path = f.name
+    temp_file_path = _create_sparse_file(file_size)
 
     try:
         total_bytes = os.path.getsize(temp_file_path)
@@ -143,11 +161,7 @@ def upload_with_progress_callback_example(client: xai_sdk.Client):
 
     # Create a temporary 5MB file
     file_size = 5 * 1024 * 1024  # 5 MB
-    with tempfile.NamedTemporaryFile(mode="wb", suffix=".bin", delete=False) as f:
-        write_chunk_size = 1024 * 1024  # 1 MB write chunks
-        for _ in range(file_size // write_chunk_size):
-            f.write(b"X" * write_chunk_size)
-        temp_file_path = f.name
+    temp_file_path = _create_sparse_file(file_size)
 
     try:
         # Define a custom progress callback
@@ -183,10 +197,12 @@ def batch_upload_example(client: xai_sdk.Client):
 
     try:
         for i in range(num_files):
-            with tempfile.NamedTemporaryFile(mode="w", suffix=f"_batch_{i}.txt", delete=False) as f:
-                f.write(f"This is test file #{i + 1} for batch upload.\n")
-                f.write("Demonstrating concurrent file uploads.\n")
-                temp_files.append(f.name)
+            temp_files.append(
+                _write_temp_file(
+                    f"This is test file #{i + 1} for batch upload.\nDemonstrating concurrent file uploads.\n".encode(),
+                    f"_batch_{i}.txt",
+                )
+            )
 
         print(f"Created {num_files} temporary files")
         print("Uploading files in batch with progress tracking...\n")
@@ -257,43 +273,63 @@ def get_example(client: xai_sdk.Client, file_id: str):
 
 
 def get_content_example(client: xai_sdk.Client, file_id: str):
-    """Demonstrate getting file content and writing it to a file."""
+    """Demonstrate getting file content."""
     print("\n=== Get File Content Example ===")
 
     # Download the file content
     content = client.files.content(file_id)
     print(f"Retrieved {len(content)} bytes of content")
 
-    # Write the content to a temporary file
+    # If it's text content, print a preview
+    preview_length = 200
+    try:
+        text_content = content.decode("utf-8")
+        preview = text_content[:preview_length]
+        if len(text_content) > preview_length:
+            preview += "..."
+        print(f"Content preview: {preview}")
+    except UnicodeDecodeError:
+        print("(Binary content, cannot display as text)")
+
+
+def download_content_example(client: xai_sdk.Client, file_id: str):
+    """Demonstrate streaming file content to a file."""
+    print("\n=== Download File Content Example ===")
+
+    # Write the content to a temporary file chunk by chunk as it is downloaded, so the file is never held in memory
+    size = 0
     with tempfile.NamedTemporaryFile(mode="wb", suffix=".txt", delete=False) as f:
-        f.write(content)
+        for chunk in client.files.iter_content(file_id):
+            f.write(chunk)
+            size += len(chunk)
         downloaded_path = f.name
 
-    try:
-        print(f"Content written to: {downloaded_path}")
+    print(f"Wrote {size} bytes of content to: {downloaded_path}")
 
-        # If it's text content, print a preview
-        preview_length = 200
-        try:
-            text_content = content.decode("utf-8")
-            preview = text_content[:preview_length]
-            if len(text_content) > preview_length:
-                preview += "..."
-            print(f"Content preview: {preview}")
-        except UnicodeDecodeError:
-            print("(Binary content, cannot display as text)")
-    finally:
-        # Clean up the downloaded file
-        os.unlink(downloaded_path)
+    # Clean up the downloaded file
+    os.unlink(downloaded_path)
 
 
-def delete_example(client: xai_sdk.Client, file_id: str):
-    """Demonstrate deleting a file."""
+def delete_example(client: xai_sdk.Client, file_ids: list[str]):
+    """Demonstrate deleting files concurrently."""
     print("\n=== Delete Example ===")
 
-    response = client.files.delete(file_id)
-    print(f"Deleted file ID: {response.id}")
-    print(f"Deletion successful: {response.deleted}")
+    def delete(file_id: str):
+        # Failures are returned rather than raised so that one failed deletion doesn't prevent the others.
+        try:
+            return client.files.delete(file_id)
+        except Exception as e:
+            return e
+
+    # The deletions are independent, so they are issued concurrently from a thread pool. Results are printed from the
+    # main thread, in order, once all of them have completed.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        responses = list(executor.map(delete, file_ids))
+    for file_id, response in zip(file_ids, responses, strict=True):
+        if isinstance(response, BaseException):
+            print(f"Failed to delete file ID {file_id}: {response}")
+        else:
+            print(f"Deleted file ID: {response.id} (successful: {response.deleted})")
 
 
 def main() -> None:
@@ -331,19 +367,11 @@ def main() -> None:
     # Get file content
     get_content_example(client, file_id)
 
-    # Delete files (cleanup)
-    delete_example(client, file_id)
-    delete_example(client, file_id_2)
-    delete_example(client, file_id_3)
-    delete_example(client, file_id_4)
-    delete_example(client, file_id_5)
-
-    # Delete batch uploaded files
-    for file_id in batch_file_ids:
-        delete_example(client, file_id)
+    # Download file content to disk
+    download_content_example(client, file_id)
 
-    # Uncomment if you ran the large file upload
-    # delete_example(client, file_id_large)
+    # Delete all uploaded files (cleanup). Add file_id_large if you ran the large file upload.
+    delete_example(client, [file_id, file_id_2, file_id_3, file_id_4, file_id_5, *batch_file_ids])
 
     print("\n=== All examples completed successfully! ===")
 
@@ -1,4 +1,6 @@
 import json
+import sys
+import time
 from typing import Literal, Sequence
 
 from absl import app, flags
@@ -9,6 +11,19 @@ from xai_sdk.chat import system, tool, tool_result, user
 
 STREAM = flags.DEFINE_bool("stream", False, "Whether streaming is enabled.")
 
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
+
+# Define the shape of the tool call arguments as a Pydantic model.
+class GetWeatherRequest(BaseModel):
+    city: str = Field(description="The name of the city to get the weather for.")
+    units: Literal["C", "F"] = Field(description="The units to use for the temperature.")
+
+
+# Generate the json schema from the Pydantic model once, rather than every time the tool is defined.
+GET_WEATHER_PARAMETERS = GetWeatherRequest.model_json_schema()
+
 
 def function_calling(client: Client) -> None:
     """Multi-turn chat with function calling."""
@@ -72,11 +87,6 @@ def function_calling(client: Client) -> None:
 def function_calling_streaming(client: Client) -> None:
     """Multi-turn chat with function calling and streaming."""
 
-    # Define the shape of the tool call arguments as a Pydantic model.
-    class GetWeatherRequest(BaseModel):
-        city: str = Field(description="The name of the city to get the weather for.")
-        units: Literal["C", "F"] = Field(description="The units to use for the temperature.")
-
     def get_weather(request: GetWeatherRequest) -> str:
         temperature = 20 if request.units == "C" else 68
         return f"The weather in {request.city} is sunny at a temperature of {temperature} {request.units}."
@@ -88,7 +98,7 @@ def function_calling_streaming(client: Client) -> None:
             tool(
                 name="get_weather",
                 description="Get the weather for a given city.",
-                parameters=GetWeatherRequest.model_json_schema(),
+                parameters=GET_WEATHER_PARAMETERS,
             )
         ],
     )
@@ -104,9 +114,14 @@ def function_calling_streaming(client: Client) -> None:
         print("Grok: ", end="", flush=True)
 
         last_response = None
+        last_flush = time.monotonic()
         for response, chunk in stream:
-            print(chunk.content, end="", flush=True)
+            sys.stdout.write(chunk.content)
             last_response = response
+            if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+                sys.stdout.flush()
+                last_flush = time.monotonic()
+        sys.stdout.flush()
 
         assert last_response is not None
         conversation.append(last_response)
@@ -120,9 +135,14 @@ def function_calling_streaming(client: Client) -> None:
 
             stream = conversation.stream()
             last_response = None
+            last_flush = time.monotonic()
             for response, chunk in stream:
-                print(chunk.content, end="", flush=True)
+                sys.stdout.write(chunk.content)
                 last_response = response
+                if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+                    sys.stdout.flush()
+                    last_flush = time.monotonic()
+            sys.stdout.flush()
 
             assert last_response is not None
             conversation.append(last_response)
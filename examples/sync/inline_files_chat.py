@@ -2,11 +2,16 @@
 
 import mimetypes
 import os
+import sys
 import tempfile
+import time
 
 from xai_sdk import Client
 from xai_sdk.chat import file, user
 
+# Streamed text is written to stdout as it arrives but only flushed at most this often, rather than once per token.
+STREAM_FLUSH_INTERVAL_SECONDS = 0.05
+
 
 def chat_with_inline_file(client: Client, file_path: str, query: str) -> None:
     """Create a chat with an inline file attachment and stream the response."""
@@ -26,10 +31,15 @@ def chat_with_inline_file(client: Client, file_path: str, query: str) -> None:
     print("Response:")
     print("-" * 80)
     final_response = None
+    last_flush = time.monotonic()
     for response, chunk in chat.stream():
         final_response = response
         if chunk.content:
-            print(chunk.content, end="", flush=True)
+            sys.stdout.write(chunk.content)
+        if time.monotonic() - last_flush >= STREAM_FLUSH_INTERVAL_SECONDS:
+            sys.stdout.flush()
+            last_flush = time.monotonic()
+    sys.stdout.flush()
     print("\n" + "-" * 80)
 
     # Show usage stats
@@ -117,12 +117,12 @@ def main(argv: Sequence[str]) -> None:
             list_embedding_models(client)
         case ("list", "image", None):
             list_image_generation_models(client)
-        case ("get", "language", model_name):
-            get_language_model(client, model_name)  # type: ignore
-        case ("get", "embedding", model_name):
-            get_embedding_model(client, model_name)  # type: ignore
-        case ("get", "image", model_name):
-            get_image_generation_model(client, model_name)  # type: ignore
+        case ("get", "language", str(model_name)):
+            get_language_model(client, model_name)
+        case ("get", "embedding", str(model_name)):
+            get_embedding_model(client, model_name)
+        case ("get", "image", str(model_name)):
+            get_image_generation_model(client, model_name)
         case _:
             raise app.UsageError("Unexpected command line arguments.")
 
@@ -41,13 +41,16 @@ def reasoning_with_streaming(client: Client) -> None:
 
     latest_response = None
     for response, chunk in chat.stream():
-        if chunk.reasoning_content:
-            print(chunk.reasoning_content, end="", flush=True)
-        if chunk.content:
+        # `Chunk` properties are recomputed on every access, so each is read once per chunk.
+        reasoning_content = chunk.reasoning_content
+        content = chunk.content
+        if reasoning_content:
+            print(reasoning_content, end="", flush=True)
+        if content:
             if first_content:
                 print("\n\n--------- Final Response ---------", flush=True)
                 first_content = False
-            print(chunk.content, end="", flush=True)
+            print(content, end="", flush=True)
 
         latest_response = response
 
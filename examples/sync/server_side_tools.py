@@ -5,6 +5,28 @@ from xai_sdk.chat import tool, tool_result, user
 from xai_sdk.tools import code_execution, get_tool_call_type, web_search, x_search
 
 
+def get_weather(city: str) -> str:
+    """Get the weather for a given city."""
+    return f"The weather in {city} is sunny."
+
+
+# The client-side tool definition is the same for every request, so it is built once.
+WEATHER_TOOL = tool(
+    name="get_weather",
+    description="Get the weather for a given city.",
+    parameters={
+        "type": "object",
+        "properties": {
+            "city": {
+                "type": "string",
+                "description": "The name of the city",
+            }
+        },
+        "required": ["city"],
+    },
+)
+
+
 def agentic_search(client: Client, model: str, query: str) -> None:
     chat = client.chat.create(
         model=model,
@@ -25,22 +47,26 @@ def agentic_search(client: Client, model: str, query: str) -> None:
 
     is_thinking = True
     for response, chunk in chat.stream():
-        for tool_call in chunk.tool_calls:
+        # `Chunk` properties are recomputed on every access, so each is read once per chunk.
+        tool_calls = chunk.tool_calls
+        tool_outputs = chunk.tool_outputs
+        content = chunk.content
+        for tool_call in tool_calls:
             print(f"\nCalling tool: {tool_call.function.name} with arguments: {tool_call.function.arguments}")
-        for tool_output in chunk.tool_outputs:
+        for tool_output in tool_outputs:
             if tool_output.content:
                 tool_call = tool_output.tool_calls[0]
                 print(
                     f"\nTool call {tool_call.function.name}({tool_call.function.arguments}) "
                     f"outputs: {tool_output.content}"
                 )
-        if response.usage.reasoning_tokens and is_thinking:
+        if is_thinking and response.usage.reasoning_tokens:
             print(f"\rThinking... ({response.usage.reasoning_tokens} tokens)", end="", flush=True)
-        if chunk.content and is_thinking:
-            print("\n\nFinal Response:")
-            is_thinking = False
-        if chunk.content and not is_thinking:
-            print(chunk.content, end="", flush=True)
+        if content:
+            if is_thinking:
+                print("\n\nFinal Response:")
+                is_thinking = False
+            print(content, end="", flush=True)
 
     print("\n\nCitations:")
     print(response.citations)
@@ -58,28 +84,9 @@ def agentic_search(client: Client, model: str, query: str) -> None:
 
 
 def agentic_tools_with_client_side_tools_encrypted_content(client: Client, model: str) -> None:
-    def get_weather(city: str) -> str:
-        """Get the weather for a given city."""
-        return f"The weather in {city} is sunny."
-
-    weather_tool = tool(
-        name="get_weather",
-        description="Get the weather for a given city.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "city": {
-                    "type": "string",
-                    "description": "The name of the city",
-                }
-            },
-            "required": ["city"],
-        },
-    )
-
     chat = client.chat.create(
         model=model,
-        tools=[web_search(), weather_tool],
+        tools=[web_search(), WEATHER_TOOL],
         use_encrypted_content=True,
     )
     chat.append(user("What is the weather in the city of the team that won the 2025 NBA championship?"))
@@ -117,28 +124,11 @@ def agentic_tools_with_client_side_tools_encrypted_content(client: Client, model
 
 
 def agentic_tools_with_client_side_tools_previous_response_id(client: Client, model: str) -> None:
-    def get_weather(city: str) -> str:
-        """Get the weather for a given city."""
-        return f"The weather in {city} is sunny."
-
-    weather_tool = tool(
-        name="get_weather",
-        description="Get the weather for a given city.",
-        parameters={
-            "type": "object",
-            "properties": {
-                "city": {
-                    "type": "string",
-                    "description": "The name of the city",
-                }
-            },
-            "required": ["city"],
-        },
-    )
-
+    # The tools are the same for every request in the conversation, so they are only built once.
+    tools = [web_search(), WEATHER_TOOL]
     chat = client.chat.create(
         model=model,
-        tools=[web_search(), weather_tool],
+        tools=tools,
         store_messages=True,
     )
     chat.append(user("What is the weather in the city of the team that won the 2025 NBA championship?"))
@@ -167,7 +157,7 @@ def agentic_tools_with_client_side_tools_previous_response_id(client: Client, mo
 
         chat = client.chat.create(
             model=model,
-            tools=[web_search(), weather_tool],
+            tools=tools,
             previous_response_id=response.id,
             store_messages=True,
         )
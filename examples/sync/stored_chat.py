@@ -58,11 +58,12 @@ def get_stored_response_batch(client: Client):
     chat.append(system("You give brief answers"))
     chat.append(user("Tell me about xAI"))
 
+    # A single request returns all 3 completions, which share the same response ID.
     original_responses = chat.sample_batch(3)
     for index, response in enumerate(original_responses):
         print(f"\nOriginal response {index}: {response.content}")
 
-    retrieved_responses = client.chat.get_stored_completion(response.id)
+    retrieved_responses = client.chat.get_stored_completion(original_responses[0].id)
     for index, response in enumerate(retrieved_responses):
         print(f"\nRetrieved response {index}: {response.content}")
 
@@ -22,7 +22,9 @@ def console_export_example(client: Client):
     Export traces to console for debugging and development.
     """
     telemetry = Telemetry()
-    telemetry.setup_console_exporter()
+    # Spans are printed in batches from a background thread so that exporting them doesn't slow down the requests.
+    # Pending spans are flushed when the process exits.
+    telemetry.setup_console_exporter(batch=True)
 
     chat = client.chat.create(model="grok-4.20-non-reasoning")
     chat.append(user("Hello, how are you?"))
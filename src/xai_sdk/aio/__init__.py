@@ -1,4 +1,4 @@
-from . import auth, batch, chat, client, collections, files, image, models, tokenizer, video
+from . import auth, batch, chat, client, collections, files, image, models, shared, tokenizer, video
 
 __all__ = [
     "auth",
@@ -9,6 +9,7 @@ __all__ = [
     "files",
     "image",
     "models",
+    "shared",
     "tokenizer",
     "video",
 ]
@@ -1,14 +1,20 @@
 import asyncio
 import datetime
-import json
 import warnings
 from typing import AsyncIterator, Optional, Sequence, TypeVar, Union
 
 from opentelemetry.trace import SpanKind
 from pydantic import BaseModel
 
-from ..chat import BaseChat, BaseClient, Chunk, CompactContextResponse, Response
-from ..poll_timer import PollTimer
+from ..chat import (
+    BaseChat,
+    BaseClient,
+    Chunk,
+    CompactContextResponse,
+    Response,
+    _deferred_poll_timer,
+    _json_schema_for_model,
+)
 from ..proto import chat_pb2, deferred_pb2
 from ..telemetry import get_tracer
 from ..types import ChatModel
@@ -358,7 +364,7 @@ class Chat(BaseChat):
         self.proto.response_format.CopyFrom(
             chat_pb2.ResponseFormat(
                 format_type=chat_pb2.FormatType.FORMAT_TYPE_JSON_SCHEMA,
-                schema=json.dumps(shape.model_json_schema()),
+                schema=_json_schema_for_model(shape),
             )
         )
 
@@ -391,7 +397,8 @@ class Chat(BaseChat):
         Args:
             n: The number of responses to generate.
             timeout: Optional maximum duration to wait for the request to complete, defaults to 10 minutes.
-            interval: Optional interval between polling attempts, defaults to 100 milliseconds.
+            interval: Optional fixed interval between polling attempts. If not set, polling starts at 100
+                milliseconds and backs off up to 2 seconds.
 
         Returns:
             chat_pb2.GetChatCompletionResponse: The raw protocol buffer response from the
@@ -401,7 +408,7 @@ class Chat(BaseChat):
             RuntimeError: If the deferred request expires.
             ValueError: If an unknown deferred status is received.
         """
-        timer = PollTimer(timeout, interval, context="waiting for deferred chat completion")
+        timer = _deferred_poll_timer(timeout, interval)
         operation = "chat.defer" if n == 1 else "chat.defer_batch"
 
         with tracer.start_as_current_span(
@@ -440,7 +447,8 @@ class Chat(BaseChat):
 
         Args:
             timeout: Optional maximum duration to wait for the request to complete, defaults to 10 minutes.
-            interval: Optional interval between polling attempts, defaults to 100 milliseconds.
+            interval: Optional fixed interval between polling attempts. If not set, polling starts at 100
+                milliseconds and backs off up to 2 seconds.
 
         Returns:
             Response: A `Response` object containing the model's output for the first (and
@@ -468,7 +476,8 @@ class Chat(BaseChat):
         Args:
             n: The number of responses to generate.
             timeout: Optional maximum duration to wait for the request to complete, defaults to 10 minutes.
-            interval: Optional interval between polling attempts, defaults to 100 milliseconds.
+            interval: Optional fixed interval between polling attempts. If not set, polling starts at 100
+                milliseconds and backs off up to 2 seconds.
 
         Returns:
             Sequence[Response]: A sequence of `Response` objects, each representing one of
@@ -492,3 +501,41 @@ class Chat(BaseChat):
 
         response = await self._defer(n, timeout, interval)
         return [Response(response, i) for i in range(n)]
+
+    async def defer_as_completed(
+        self, n: int, *, timeout: Optional[datetime.timedelta] = None, interval: Optional[datetime.timedelta] = None
+    ) -> AsyncIterator[Response]:
+        """Asynchronously samples `n` chat completion responses using polling, yielding each as soon as it is ready.
+
+        This method starts `n` independent deferred requests concurrently and yields their responses in completion
+        order, so the first response is available without waiting for the slowest one. If the iteration is stopped
+        early, the remaining requests are cancelled.
+
+        Unlike `defer_batch`, which sends one request with `n` set, this sends `n` separate requests for one response
+        each, so the prompt is processed, and billed, `n` times.
+
+        Args:
+            n: The number of responses to generate.
+            timeout: Optional maximum duration to wait for each request to complete, defaults to 10 minutes.
+            interval: Optional fixed interval between polling attempts. If not set, polling starts at 100
+                milliseconds and backs off up to 2 seconds.
+
+        Yields:
+            Response: A `Response` object for each of the `n` requests, in the order they complete.
+
+        Example:
+            >>> chat = client.chat.create(model="grok-4.20-non-reasoning")
+            >>> chat.append(user("Suggest a gift"))
+            >>> async for response in chat.defer_as_completed(3, timeout=datetime.timedelta(minutes=5)):
+            ...     print(response.content)
+            ...     break  # Only the first response is needed, the other requests are cancelled.
+            A book
+        """
+        tasks = [asyncio.ensure_future(self._defer(1, timeout, interval)) for _ in range(n)]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield Response(await next_completed, 0)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
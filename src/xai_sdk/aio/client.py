@@ -1,3 +1,4 @@
+import asyncio
 import os
 from typing import Any, Optional, Sequence
 
@@ -115,6 +116,24 @@ class Client(BaseClient):
             )
         return channel
 
+    async def connect(self, timeout: Optional[float] = None) -> None:
+        """Establishes the connection to the xAI API ahead of the first request.
+
+        gRPC channels connect lazily, so without this the first request also pays for name resolution and the TCP and
+        TLS handshakes. Calling it up front, e.g. before waiting for user input, takes that latency off the critical
+        path of the first request.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the connection. Waits indefinitely if not provided.
+
+        Raises:
+            TimeoutError: If the connection could not be established within `timeout` seconds.
+        """
+        try:
+            await asyncio.wait_for(self._api_channel.channel_ready(), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Could not connect to the xAI API within {timeout} seconds.") from None
+
     async def close(self) -> None:
         """Close method to properly clean up gRPC channels."""
         if self._management_channel is not None:
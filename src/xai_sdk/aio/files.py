@@ -1,14 +1,15 @@
 import asyncio
 import datetime
+import inspect
 import os
 from asyncio import Semaphore
-from typing import BinaryIO, Optional, Sequence, Union
+from typing import AsyncIterator, BinaryIO, Optional, Sequence, Union
 
 from opentelemetry.trace import SpanKind
 
 from ..files import (
+    AsyncBatchUploadCallback,
     BaseClient,
-    BatchUploadCallback,
     Order,
     ProgressCallback,
     SortBy,
@@ -154,7 +155,7 @@ class Client(BaseClient):
         files: Sequence[Union[str, BinaryIO]],
         *,
         batch_size: int = 50,
-        on_file_complete: Optional[BatchUploadCallback] = None,
+        on_file_complete: Optional[AsyncBatchUploadCallback] = None,
     ) -> dict[int, Union[files_pb2.File, BaseException]]:
         """Batch upload multiple files asynchronously with controlled concurrency.
 
@@ -167,10 +168,13 @@ class Client(BaseClient):
                    - BinaryIO: File-like object with a .name attribute (e.g., open(..., "rb"))
                 Note: Raw bytes are not supported in batch mode. Use the upload() method
                 directly for bytes, or wrap bytes in io.BytesIO with a name attribute.
-            batch_size: Maximum number of concurrent uploads. Defaults to 50.
+            batch_size: Maximum number of concurrent uploads. Defaults to 50. A new upload starts as soon as any
+                in-flight upload finishes, rather than waiting for a whole batch to complete.
             on_file_complete: Optional callback invoked after each file upload completes (success or failure).
                 The callback receives three arguments: (index: int, file: str | BinaryIO, result: File | BaseException).
-                Use this to track progress or log individual file results in real-time.
+                Use this to track progress or log individual file results in real-time. The callback may also be a
+                coroutine function. It is awaited after the upload's concurrency slot has been released, so other
+                uploads keep going while it runs.
 
         Returns:
             Dictionary mapping file indices (0-based position in input list) to results.
@@ -215,16 +219,19 @@ class Client(BaseClient):
         results: dict[int, Union[files_pb2.File, BaseException]] = {}
 
         async def upload_file(file: Union[str, BinaryIO], index: int) -> None:
+            result: Union[files_pb2.File, BaseException]
             try:
                 async with semaphore:
                     result = await self.upload(file)
-                    results[index] = result
-                    if on_file_complete:
-                        on_file_complete(index, file, result)
             except BaseException as e:
-                results[index] = e
-                if on_file_complete:
-                    on_file_complete(index, file, e)
+                result = e
+            # The callback is invoked after the slot has been released, so that a slow async callback doesn't delay
+            # the next upload.
+            results[index] = result
+            if on_file_complete:
+                callback_result = on_file_complete(index, file, result)
+                if inspect.isawaitable(callback_result):
+                    await callback_result
 
         tasks = [upload_file(file, i) for i, file in enumerate(files)]
         await asyncio.gather(*tasks, return_exceptions=True)
@@ -324,15 +331,28 @@ class Client(BaseClient):
         Returns:
             The complete file content as bytes.
         """
-        request = files_pb2.RetrieveFileContentRequest(file_id=file_id)
-        chunks = self._stub.RetrieveFileContent(request)
+        return b"".join([chunk async for chunk in self.iter_content(file_id)])
+
+    async def iter_content(self, file_id: str) -> AsyncIterator[bytes]:
+        """Iterate over the content of a file as it is downloaded.
+
+        Unlike `content`, the file is never held in memory as a whole, which makes this method suitable for
+        writing large files to disk.
+
+        Args:
+            file_id: The ID of the file to retrieve.
 
-        # Collect all chunks into a single bytes object
-        content_parts = []
-        async for chunk in chunks:
-            content_parts.append(chunk.data)
+        Yields:
+            The file content, one chunk at a time, in order.
 
-        return b"".join(content_parts)
+        Example:
+            >>> with open("downloaded.bin", "wb") as f:
+            ...     async for chunk in client.files.iter_content(file_id):
+            ...         f.write(chunk)
+        """
+        request = files_pb2.RetrieveFileContentRequest(file_id=file_id)
+        async for chunk in self._stub.RetrieveFileContent(request):
+            yield chunk.data
 
     async def create_public_url(
         self,
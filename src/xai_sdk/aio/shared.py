@@ -0,0 +1,121 @@
+import asyncio
+import warnings
+from typing import Any, Coroutine, Optional, TypeVar
+
+from .client import Client
+
+T = TypeVar("T")
+
+# The shared client and the event loop it was created on. gRPC aio channels are bound to the event loop they are
+# first used on, so a new client is created whenever the shared one belongs to a different (e.g. closed) loop.
+_shared_client: Optional[Client] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# The event loop used by `run`, kept open between calls.
+_runner_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# How long to wait for a client bound to an event loop in another thread to be closed on that loop.
+_CLOSE_TIMEOUT_SECONDS = 10.0
+
+
+async def get_async_client() -> Client:
+    """Returns a process-wide `AsyncClient` that is created lazily on first use.
+
+    Reusing a single client lets independent parts of an application share the same gRPC channels, so that
+    channel setup and TLS handshakes are only paid once. The client is configured from the `XAI_API_KEY` and
+    `XAI_MANAGEMENT_KEY` environment variables.
+
+    gRPC channels are bound to the event loop they are used on. If the shared client was created on a different event
+    loop, it is closed and replaced; a `RuntimeWarning` is emitted if that loop is no longer running, since the old
+    client can then no longer be closed.
+
+    This is a coroutine function even though it does not await anything itself: it must be called from the event
+    loop the returned client will be used on, and requiring `await` guarantees that a loop is running.
+
+    Returns:
+        The shared client bound to the running event loop.
+    """
+    global _shared_client, _shared_client_loop  # noqa: PLW0603
+    loop = asyncio.get_running_loop()
+    # Creating the client does not yield to the event loop, so no lock is needed to guard the check below.
+    if _shared_client is None or _shared_client_loop is not loop:
+        if _shared_client is not None and _shared_client_loop is not None:
+            _close_on_loop(_shared_client, _shared_client_loop)
+        _shared_client = Client()
+        _shared_client_loop = loop
+    return _shared_client
+
+
+async def close_async_client() -> None:
+    """Closes the shared `AsyncClient`, if one was created.
+
+    A subsequent call to `get_async_client` creates a new client. Call this before the event loop the client was
+    created on is closed.
+    """
+    global _shared_client, _shared_client_loop  # noqa: PLW0603
+    client, loop = _shared_client, _shared_client_loop
+    _shared_client = None
+    _shared_client_loop = None
+    if client is None or loop is None:
+        return
+    if loop is asyncio.get_running_loop():
+        await client.close()
+    else:
+        _close_on_loop(client, loop)
+
+
+def _close_on_loop(client: Client, loop: asyncio.AbstractEventLoop) -> None:
+    """Closes a client that is bound to an event loop other than the running one.
+
+    The client can only be closed on its own loop. If that loop is running in another thread, the close is run there
+    and waited for, for up to `_CLOSE_TIMEOUT_SECONDS`; otherwise a warning is emitted, since the client's channels
+    can no longer be closed cleanly.
+    """
+    if loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.close(), loop).result(timeout=_CLOSE_TIMEOUT_SECONDS)
+        return
+    warnings.warn(
+        "The shared AsyncClient was bound to an event loop that is no longer running, so it could not be closed. "
+        "Call `close_async_client()` before the event loop it was created on is closed.",
+        RuntimeWarning,
+        stacklevel=3,
+    )
+
+
+def run(coro: Coroutine[Any, Any, T]) -> T:
+    """Runs a coroutine to completion on a persistent event loop and returns its result.
+
+    Unlike `asyncio.run`, which creates and closes a new event loop on every call, the loop is kept open between
+    calls. The client returned by `get_async_client` and its channels therefore stay usable across calls, which avoids
+    reconnecting when an entry point is invoked repeatedly, e.g. from a REPL or a test harness. Call `shutdown` once
+    the loop is no longer needed.
+
+    Args:
+        coro: The coroutine to run.
+
+    Returns:
+        The result of the coroutine.
+    """
+    global _runner_loop  # noqa: PLW0603
+    if _runner_loop is None or _runner_loop.is_closed():
+        _runner_loop = asyncio.new_event_loop()
+    return _runner_loop.run_until_complete(coro)
+
+
+def shutdown() -> None:
+    """Closes the shared `AsyncClient` and the event loop used by `run`, if they were created.
+
+    Asynchronous generators and the loop's default executor are shut down before the loop is closed. A subsequent
+    call to `run` creates a new event loop.
+    """
+    global _runner_loop  # noqa: PLW0603
+    loop = _runner_loop
+    _runner_loop = None
+    if loop is None or loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(close_async_client())
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        loop.close()
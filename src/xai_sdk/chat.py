@@ -1,5 +1,6 @@
 import abc
 import datetime
+import functools
 import json
 from collections import Counter, defaultdict
 from typing import Any, Generic, Optional, Sequence, TypeVar, Union, overload
@@ -10,6 +11,7 @@ from typing_extensions import Self
 
 from .cost import cost_usd_from_usage
 from .meta import ProtoDecorator
+from .poll_timer import PollTimer
 from .proto import chat_pb2, chat_pb2_grpc, image_pb2, sample_pb2, usage_pb2
 from .search import SearchParameters
 from .service_tier import service_tier_from_proto, service_tier_to_proto
@@ -30,6 +32,12 @@ from .types import (
 
 T = TypeVar("T")
 
+# Unless a fixed `interval` is given, deferred completions are first polled after a short interval, so that fast
+# completions are picked up quickly, and polling backs off for completions that take longer.
+DEFAULT_DEFERRED_INITIAL_POLL_INTERVAL = datetime.timedelta(milliseconds=100)
+DEFAULT_DEFERRED_MAX_POLL_INTERVAL = datetime.timedelta(seconds=2)
+DEFAULT_DEFERRED_POLL_BACKOFF_FACTOR = 1.5
+
 
 class BaseClient(abc.ABC, Generic[T]):
     """Base Client for interacting with the `Chat` API."""
@@ -198,7 +206,7 @@ class BaseClient(abc.ABC, Generic[T]):
         elif isinstance(response_format, type) and issubclass(response_format, BaseModel):
             response_format_pb = chat_pb2.ResponseFormat(
                 format_type=chat_pb2.FORMAT_TYPE_JSON_SCHEMA,
-                schema=json.dumps(response_format.model_json_schema()),
+                schema=_json_schema_for_model(response_format),
             )
         else:
             response_format_pb = response_format
@@ -965,6 +973,33 @@ def _format_type_to_proto(format_type: ResponseFormat) -> chat_pb2.FormatType:
             raise ValueError(f"Invalid response format: {format_type}. Must be one of: {ResponseFormat.__args__}")
 
 
+def _deferred_poll_timer(timeout: Optional[datetime.timedelta], interval: Optional[datetime.timedelta]) -> PollTimer:
+    """Creates the timer used when polling for a deferred chat completion.
+
+    A fixed `interval` is used as is. Otherwise, polling starts at `DEFAULT_DEFERRED_INITIAL_POLL_INTERVAL` and
+    backs off up to `DEFAULT_DEFERRED_MAX_POLL_INTERVAL`.
+    """
+    if interval is not None:
+        return PollTimer(timeout, interval, context="waiting for deferred chat completion")
+    return PollTimer(
+        timeout,
+        DEFAULT_DEFERRED_INITIAL_POLL_INTERVAL,
+        context="waiting for deferred chat completion",
+        max_interval=DEFAULT_DEFERRED_MAX_POLL_INTERVAL,
+        backoff_factor=DEFAULT_DEFERRED_POLL_BACKOFF_FACTOR,
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _json_schema_for_model(model: type[BaseModel]) -> str:
+    """Returns the serialized JSON schema of a Pydantic model.
+
+    Generating the schema walks the whole model, so it is cached per model class rather than recomputed every time
+    the same model is used as a response format.
+    """
+    return json.dumps(model.model_json_schema())
+
+
 class Chunk(ProtoDecorator[chat_pb2.GetChatCompletionChunk]):
     """Adds convenience functions to the chunk proto."""
 
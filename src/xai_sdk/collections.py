@@ -1,10 +1,12 @@
 import datetime
+import warnings
 from typing import Literal, Optional, Union
 
 import grpc
 from pydantic import TypeAdapter
 from typing_extensions import NotRequired, TypedDict
 
+from .poll_timer import PollTimer
 from .proto import (
     collections_pb2,
     collections_pb2_grpc,
@@ -21,9 +23,29 @@ DocumentSortBy = Literal["name", "age", "size"]
 HNSWMetric = Literal["cosine", "euclidean", "inner_product"]
 DocumentRetrievalMode = Literal["hybrid", "semantic", "keyword"]
 
-DEFAULT_INDEXING_POLL_INTERVAL = datetime.timedelta(seconds=10)
+# Unless a fixed `poll_interval` is given, waiting for indexing starts with short polls, so that small documents are
+# picked up quickly, and backs off for documents that take longer to index.
+DEFAULT_INDEXING_INITIAL_POLL_INTERVAL = datetime.timedelta(milliseconds=100)
+DEFAULT_INDEXING_MAX_POLL_INTERVAL = datetime.timedelta(seconds=2)
+DEFAULT_INDEXING_POLL_BACKOFF_FACTOR = 1.25
 DEFAULT_INDEXING_TIMEOUT = datetime.timedelta(minutes=2)
 
+# The fixed interval that was used before polling backed off. It is no longer used by the SDK, and accessing it emits a
+# `DeprecationWarning` (see `__getattr__` below).
+_DEPRECATED_INDEXING_POLL_INTERVAL = datetime.timedelta(seconds=10)
+
+
+def __getattr__(name: str):
+    if name == "DEFAULT_INDEXING_POLL_INTERVAL":
+        warnings.warn(
+            "DEFAULT_INDEXING_POLL_INTERVAL is deprecated and no longer used: waiting for indexing now backs off from "
+            "DEFAULT_INDEXING_INITIAL_POLL_INTERVAL up to DEFAULT_INDEXING_MAX_POLL_INTERVAL.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return _DEPRECATED_INDEXING_POLL_INTERVAL
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class FieldDefinition(TypedDict):
     """Definition of a field that can be attached to documents in a collection.
@@ -253,3 +275,20 @@ def _chunk_configuration_to_pb(chunk_config: ChunkConfiguration) -> types_pb2.Ch
     validated = ChunkConfigurationValidator.validate_python(chunk_config)
     _validate_chunk_configuration(validated)
     return types_pb2.ChunkConfiguration(**validated)
+
+
+def _indexing_poll_timer(poll_interval: Optional[datetime.timedelta], timeout: datetime.timedelta) -> PollTimer:
+    """Creates the timer used when waiting for a document to be indexed.
+
+    A fixed `poll_interval` is used as is. Otherwise, polling starts at `DEFAULT_INDEXING_INITIAL_POLL_INTERVAL` and
+    backs off up to `DEFAULT_INDEXING_MAX_POLL_INTERVAL`.
+    """
+    if poll_interval is not None:
+        return PollTimer(timeout, poll_interval, context="waiting for document to be indexed")
+    return PollTimer(
+        timeout,
+        DEFAULT_INDEXING_INITIAL_POLL_INTERVAL,
+        context="waiting for document to be indexed",
+        max_interval=DEFAULT_INDEXING_MAX_POLL_INTERVAL,
+        backoff_factor=DEFAULT_INDEXING_POLL_BACKOFF_FACTOR,
+    )
@@ -1,7 +1,7 @@
 import asyncio
 import datetime
 import os
-from typing import Any, AsyncIterator, BinaryIO, Callable, Iterator, Literal, Optional, Protocol, Union
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Iterator, Literal, Optional, Protocol, Union
 
 import grpc
 from pydantic import TypeAdapter
@@ -105,6 +105,11 @@ ProgressCallback = Union[Callable[[int, int], None], Callable[[int], None], Prog
 # Type for batch upload completion callbacks
 BatchUploadCallback = Callable[[int, Union[str, BinaryIO], Union["files_pb2.File", BaseException]], None]
 
+# Type for async batch upload completion callbacks, which may also be coroutine functions
+AsyncBatchUploadCallback = Callable[
+    [int, Union[str, BinaryIO], Union["files_pb2.File", BaseException]], Optional[Awaitable[None]]
+]
+
 
 class BaseClient:
     """Base Client for interacting with the `Files` API."""
@@ -15,6 +15,9 @@ class PollTimer:
         timeout: Optional[datetime.timedelta] = None,
         interval: Optional[datetime.timedelta] = None,
         context: Optional[str] = None,
+        *,
+        max_interval: Optional[datetime.timedelta] = None,
+        backoff_factor: float = 1.0,
     ) -> None:
         """Creates a new instance of the `PollTimer` class.
 
@@ -23,11 +26,16 @@ class PollTimer:
             interval: Time to wait between polls.
             context: A description of what is being waited on (e.g. "waiting for document to be indexed").
                 Included in the TimeoutError message for easier debugging.
+            max_interval: Upper bound for the time to wait between polls when `backoff_factor` is greater than 1.
+                If not set, the interval is not capped.
+            backoff_factor: Factor by which the interval grows after every poll. Defaults to 1, i.e. a fixed interval.
         """
         self._start = time.time()
         self._timeout = timeout or datetime.timedelta(minutes=10)
         self._interval = interval or datetime.timedelta(seconds=1)
         self._context = context
+        self._max_interval = max_interval
+        self._backoff_factor = backoff_factor
 
     def sleep_interval_or_raise(self) -> float:
         """Returns the time to sleep until the next poll.
@@ -45,4 +53,9 @@ class PollTimer:
                 message += f": {self._context}"
             raise TimeoutError(message)
         else:
-            return min(self._timeout.total_seconds() - runtime, self._interval.total_seconds())
+            interval = self._interval
+            if self._backoff_factor != 1.0:
+                self._interval = interval * self._backoff_factor
+                if self._max_interval is not None:
+                    self._interval = min(self._interval, self._max_interval)
+            return min(self._timeout.total_seconds() - runtime, interval.total_seconds())
@@ -1,7 +1,8 @@
-from typing import Optional, Sequence, Union
+from typing import Iterator, Optional, Sequence, Union
 
 from ..batch import (
     BaseClient,
+    BatchResult,
     ListBatchResultsResponse,
 )
 from ..chat import BaseChat
@@ -248,3 +249,46 @@ class Client(BaseClient):
         )
 
         return ListBatchResultsResponse(list_batch_results_response_pb)
+
+    def stream_batch_results(self, batch_id: str, limit: Optional[int] = None) -> Iterator[BatchResult]:
+        """Iterate over all results of the batch with given ID, fetching them one page at a time.
+
+        Results are yielded as soon as their page has been received, so they can be processed before all results
+        have been fetched and only a single page is held in memory at a time.
+
+        Args:
+            batch_id: The ID of the batch to stream results for.
+            limit: The number of results to fetch per page. Uses server default if not provided.
+
+        Yields:
+            A `BatchResult` for every request in the batch, both succeeded and failed ones.
+
+        Examples:
+            ```
+            from xai_sdk import Client
+
+            client = Client()
+
+            # Assume you have created a batch with ID "batch_1234"
+
+            for result in client.batch.stream_batch_results("batch_1234"):
+                if result.is_success:
+                    print(result.response.content)
+                else:
+                    print(result.error_message)
+            ```
+        """
+        pagination_token = None
+        while True:
+            page = self._stub.ListBatchResults(
+                batch_pb2.ListBatchResultsRequest(
+                    batch_id=batch_id,
+                    limit=limit,
+                    pagination_token=pagination_token,
+                ),
+            )
+            for result in page.results:
+                yield BatchResult(result)
+            if not page.pagination_token:
+                return
+            pagination_token = page.pagination_token
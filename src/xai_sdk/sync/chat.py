@@ -1,5 +1,4 @@
 import datetime
-import json
 import time
 import warnings
 from typing import Iterator, Optional, Sequence, TypeVar, Union
@@ -7,8 +6,15 @@ from typing import Iterator, Optional, Sequence, TypeVar, Union
 from opentelemetry.trace import SpanKind
 from pydantic import BaseModel
 
-from ..chat import BaseChat, BaseClient, Chunk, CompactContextResponse, Response
-from ..poll_timer import PollTimer
+from ..chat import (
+    BaseChat,
+    BaseClient,
+    Chunk,
+    CompactContextResponse,
+    Response,
+    _deferred_poll_timer,
+    _json_schema_for_model,
+)
 from ..proto import chat_pb2, deferred_pb2
 from ..telemetry import get_tracer
 from ..types import ChatModel
@@ -349,7 +355,7 @@ class Chat(BaseChat):
         self.proto.response_format.CopyFrom(
             chat_pb2.ResponseFormat(
                 format_type=chat_pb2.FormatType.FORMAT_TYPE_JSON_SCHEMA,
-                schema=json.dumps(shape.model_json_schema()),
+                schema=_json_schema_for_model(shape),
             )
         )
 
@@ -379,7 +385,8 @@ class Chat(BaseChat):
         Args:
             n: The number of responses to generate.
             timeout: Optional maximum duration to wait for the request to complete, defaults to 10 minutes.
-            interval: Optional interval between polling attempts, defaults to 100 milliseconds.
+            interval: Optional fixed interval between polling attempts. If not set, polling starts at 100
+                milliseconds and backs off up to 2 seconds.
 
         Returns:
             chat_pb2.GetChatCompletionResponse: The raw protocol buffer response from the
@@ -389,7 +396,7 @@ class Chat(BaseChat):
             RuntimeError: If the deferred request expires.
             ValueError: If an unknown deferred status is received.
         """
-        timer = PollTimer(timeout, interval, context="waiting for deferred chat completion")
+        timer = _deferred_poll_timer(timeout, interval)
         operation = "chat.defer" if n == 1 else "chat.defer_batch"
 
         with tracer.start_as_current_span(
@@ -426,7 +433,8 @@ class Chat(BaseChat):
 
         Args:
             timeout: Optional maximum duration to wait for the request to complete, defaults to 10 minutes.
-            interval: Optional interval between polling attempts, defaults to 100 milliseconds.
+            interval: Optional fixed interval between polling attempts. If not set, polling starts at 100
+                milliseconds and backs off up to 2 seconds.
 
         Returns:
             Response: A `Response` object containing the model's output for the first (and
@@ -454,7 +462,8 @@ class Chat(BaseChat):
         Args:
             n: The number of responses to generate.
             timeout: Optional maximum duration to wait for the request to complete, defaults to 10 minutes.
-            interval: Optional interval between polling attempts, defaults to 100 milliseconds.
+            interval: Optional fixed interval between polling attempts. If not set, polling starts at 100
+                milliseconds and backs off up to 2 seconds.
 
         Returns:
             Sequence[Response]: A sequence of `Response` objects, each representing one of
@@ -95,6 +95,24 @@ class Client(BaseClient):
             channel = grpc.intercept_channel(channel, timeout_interceptor)
         return channel
 
+    def connect(self, timeout: Optional[float] = None) -> None:
+        """Establishes the connection to the xAI API ahead of the first request.
+
+        gRPC channels connect lazily, so without this the first request also pays for name resolution and the TCP and
+        TLS handshakes. Calling it up front, e.g. before waiting for user input, takes that latency off the critical
+        path of the first request.
+
+        Args:
+            timeout: Maximum number of seconds to wait for the connection. Waits indefinitely if not provided.
+
+        Raises:
+            TimeoutError: If the connection could not be established within `timeout` seconds.
+        """
+        try:
+            grpc.channel_ready_future(self._api_channel).result(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            raise TimeoutError(f"Could not connect to the xAI API within {timeout} seconds.") from None
+
     def close(self) -> None:
         """Close method to properly clean up gRPC channels."""
         if self._management_channel is not None:
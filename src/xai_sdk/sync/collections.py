@@ -1,12 +1,11 @@
 import datetime
 import time
 import warnings
-from typing import Optional, Sequence, Union
+from typing import BinaryIO, Optional, Sequence, Union
 
 from opentelemetry.trace import SpanKind
 
 from ..collections import (
-    DEFAULT_INDEXING_POLL_INTERVAL,
     DEFAULT_INDEXING_TIMEOUT,
     BaseClient,
     ChunkConfiguration,
@@ -23,10 +22,10 @@ from ..collections import (
     _field_definition_to_pb,
     _field_definition_update_to_pb,
     _hnsw_metric_to_pb,
+    _indexing_poll_timer,
     _order_to_pb,
 )
-from ..files import _chunk_file_data
-from ..poll_timer import PollTimer
+from ..files import _chunk_file_data, _chunk_file_from_fileobj
 from ..proto import collections_pb2, documents_pb2, shared_pb2, types_pb2
 from ..telemetry import get_tracer
 
@@ -333,7 +332,7 @@ class Client(BaseClient):
         self,
         collection_id: str,
         name: str,
-        data: bytes,
+        data: Union[bytes, BinaryIO],
         fields: Optional[dict[str, str]] = None,
         *,
         wait_for_indexing: bool = False,
@@ -345,17 +344,22 @@ class Client(BaseClient):
         Args:
             collection_id: The ID of the collection to upload the document to.
             name: The name of the document.
-            data: The data of the document.
+            data: The data of the document. Either raw bytes or a binary file-like object, which is streamed to the
+                server in chunks instead of being read into memory up front.
             fields: Additional metadata fields to store with the document.
             wait_for_indexing: Whether to wait for the document to be indexed.
-            poll_interval: The interval to poll for when checking whether the document has been indexed.
+            poll_interval: The interval to poll for when checking whether the document has been indexed. If not
+                provided, polling starts at 100ms and backs off by 1.25x per poll up to 2s.
             timeout: The total time to wait for the document to be indexed before returning.
 
         Returns:
             The metadata for the uploaded document.
         """
         # Upload the raw bytes via the streaming Files API, then attach to the collection.
-        upload_chunks = _chunk_file_data(filename=name, data=data)
+        if isinstance(data, bytes | bytearray):
+            upload_chunks = _chunk_file_data(filename=name, data=bytes(data))
+        else:
+            upload_chunks = _chunk_file_from_fileobj(file_obj=data, filename=name)
         with tracer.start_as_current_span(
             name="collections.upload_document",
             kind=SpanKind.CLIENT,
@@ -382,7 +386,7 @@ class Client(BaseClient):
             return self._wait_for_indexing_to_complete(
                 collection_id,
                 uploaded_file.id,
-                poll_interval or DEFAULT_INDEXING_POLL_INTERVAL,
+                poll_interval,
                 timeout or DEFAULT_INDEXING_TIMEOUT,
             )
 
@@ -395,7 +399,7 @@ class Client(BaseClient):
         self,
         collection_id: str,
         file_id: str,
-        poll_interval: datetime.timedelta,
+        poll_interval: Optional[datetime.timedelta],
         timeout: datetime.timedelta,
     ) -> collections_pb2.DocumentMetadata:
         """Waits for a document to be indexed.
@@ -403,7 +407,8 @@ class Client(BaseClient):
         Args:
             collection_id: The ID of the collection containing the document.
             file_id: The ID of the document to wait for.
-            poll_interval: The interval to poll for when checking whether the document has been indexed.
+            poll_interval: The interval to poll for when checking whether the document has been indexed. If None,
+                the interval starts short and backs off while the document is still being indexed.
             timeout: The total time to wait for the document to be indexed before returning.
 
         Returns:
@@ -413,7 +418,7 @@ class Client(BaseClient):
             ValueError: If the document indexing fails.
             TimeoutError: If polling times out before document is processed.
         """
-        timer = PollTimer(timeout, poll_interval, context="waiting for document to be indexed")
+        timer = _indexing_poll_timer(poll_interval, timeout)
         while True:
             document_metadata = self.get_document(
                 file_id,
@@ -1,7 +1,7 @@
 import datetime
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import BinaryIO, Optional, Sequence, Union
+from typing import BinaryIO, Iterator, Optional, Sequence, Union
 
 from opentelemetry.trace import SpanKind
 
@@ -325,15 +325,28 @@ class Client(BaseClient):
         Returns:
             The complete file content as bytes.
         """
-        request = files_pb2.RetrieveFileContentRequest(file_id=file_id)
-        chunks = self._stub.RetrieveFileContent(request)
+        return b"".join(self.iter_content(file_id))
+
+    def iter_content(self, file_id: str) -> Iterator[bytes]:
+        """Iterate over the content of a file as it is downloaded.
+
+        Unlike `content`, the file is never held in memory as a whole, which makes this method suitable for
+        writing large files to disk.
+
+        Args:
+            file_id: The ID of the file to retrieve.
 
-        # Collect all chunks into a single bytes object
-        content_parts = []
-        for chunk in chunks:
-            content_parts.append(chunk.data)
+        Yields:
+            The file content, one chunk at a time, in order.
 
-        return b"".join(content_parts)
+        Example:
+            >>> with open("downloaded.bin", "wb") as f:
+            ...     for chunk in client.files.iter_content(file_id):
+            ...         f.write(chunk)
+        """
+        request = files_pb2.RetrieveFileContentRequest(file_id=file_id)
+        for chunk in self._stub.RetrieveFileContent(request):
+            yield chunk.data
 
     def create_public_url(
         self,
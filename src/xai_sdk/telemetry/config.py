@@ -166,7 +166,7 @@ class Telemetry:
             )
         )
 
-    def setup_console_exporter(self, **kwargs):
+    def setup_console_exporter(self, *, batch: bool = False, **kwargs):
         """Configure console trace exporter for debugging and development.
 
         Sets up a console exporter that prints trace data to stdout, useful for
@@ -174,9 +174,14 @@ class Telemetry:
         JSON output showing span details, timing, and attributes.
 
         Args:
+            batch: Whether to export spans in batches from a background thread instead of
+                synchronously as each span ends. Batching keeps the export off the request path,
+                at the cost of spans being printed with a delay. Defaults to False.
             **kwargs: Additional arguments passed to the OpenTelemetry ConsoleSpanExporter constructor.
         """
-        self.provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter(**kwargs)))
+        exporter = ConsoleSpanExporter(**kwargs)
+        processor = BatchSpanProcessor(exporter) if batch else SimpleSpanProcessor(exporter)
+        self.provider.add_span_processor(processor)
 
 
 def get_tracer(name: str) -> otel_trace.Tracer:
@@ -6,6 +6,12 @@ from google.protobuf.timestamp_pb2 import Timestamp
 from xai_sdk.collections import DocumentRetrievalMode
 from xai_sdk.proto import chat_pb2, documents_pb2
 
+# Maps every `ToolCallType` value to the name returned by `get_tool_call_type`, computed once at import time because
+# the function is typically called for every tool call of a streamed response.
+_TOOL_CALL_TYPE_NAMES = {
+    value: name.removeprefix("TOOL_CALL_TYPE_").lower() for name, value in chat_pb2.ToolCallType.items()
+}
+
 
 def web_search(
     excluded_domains: Optional[list[str]] = None,
@@ -300,4 +306,8 @@ def get_tool_call_type(tool_call: chat_pb2.ToolCall) -> str:
         The type of the tool call as a string, valid values are: "client_side_tool", "web_search_tool",
         "x_search_tool", "code_execution_tool", "collections_search_tool", "mcp_tool", "attachment_search_tool".
     """
-    return chat_pb2.ToolCallType.Name(tool_call.type).removeprefix("TOOL_CALL_TYPE_").lower()
+    try:
+        return _TOOL_CALL_TYPE_NAMES[tool_call.type]
+    except KeyError:
+        # Let protobuf raise its usual error for values that are not part of the enum.
+        return chat_pb2.ToolCallType.Name(tool_call.type).removeprefix("TOOL_CALL_TYPE_").lower()
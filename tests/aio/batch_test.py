@@ -300,6 +300,24 @@ async def test_list_batch_results_pagination(client: AsyncClient):
     assert page3.pagination_token is None  # No more pages
 
 
+@pytest.mark.asyncio
+async def test_stream_batch_results(client: AsyncClient):
+    """Test that stream_batch_results yields the results of all pages."""
+    batch = await client.batch.create("test_batch")
+
+    batch_requests = []
+    for i in range(5):
+        chat = client.chat.create(model="grok-3-latest", batch_request_id=f"req_{i}")
+        chat.append(user(f"Message {i}"))
+        batch_requests.append(chat)
+
+    await client.batch.add(batch.batch_id, batch_requests)
+
+    results = [result async for result in client.batch.stream_batch_results(batch.batch_id, limit=2)]
+    assert sorted(result.batch_request_id for result in results) == [f"req_{i}" for i in range(5)]
+    assert all(result.is_success for result in results)
+
+
 @pytest.mark.asyncio
 async def test_get_nonexistent_batch(client: AsyncClient):
     """Test getting a non-existent batch raises an error."""
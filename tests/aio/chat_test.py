@@ -155,6 +155,27 @@ async def test_deferred_batch(client):
         assert r.content == "Hello, this is a test response!"
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_deferred_as_completed(client):
+    chat = client.chat.create("grok-3-latest")
+    chat.append(user("test message"))
+    responses = [response async for response in chat.defer_as_completed(3)]
+    assert len(responses) == 3
+
+    for r in responses:
+        assert r.content == "Hello, this is a test response!"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_deferred_as_completed_stops_early(client):
+    chat = client.chat.create("grok-3-latest")
+    chat.append(user("test message"))
+    responses = chat.defer_as_completed(3)
+    first = await anext(responses)
+    assert first.content == "Hello, this is a test response!"
+    await responses.aclose()
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_function_calling(client):
     chat = client.chat.create(
@@ -1,4 +1,5 @@
 import grpc
+import portpicker
 import pytest
 
 from xai_sdk import AsyncClient
@@ -27,6 +28,24 @@ async def test_client(test_server_port):
     assert api_key.redacted_api_key == "1**"
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_client_connect(test_server_port):
+    client = AsyncClient(api_key=server.API_KEY, api_host=f"localhost:{test_server_port}")
+
+    await client.connect(timeout=5)
+
+    api_key = await client.auth.get_api_key_info()
+    assert api_key.redacted_api_key == "1**"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_client_connect_timeout():
+    client = AsyncClient(api_key=server.API_KEY, api_host=f"localhost:{portpicker.pick_unused_port()}")
+
+    with pytest.raises(TimeoutError):
+        await client.connect(timeout=0.1)
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_client_wrong_api_key(test_server_port):
     client = AsyncClient(api_key=server.API_KEY + "bad", api_host=f"localhost:{test_server_port}")
@@ -1,6 +1,7 @@
 # ruff noqa: DTZ005
 
 
+import io
 import uuid
 from typing import Union
 from unittest import mock
@@ -645,6 +646,20 @@ async def test_upload_document(client: AsyncClient):
     assert response.fields == fields
 
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_upload_document_from_file_object(client: AsyncClient):
+    collection_metadata = await client.collections.create(f"test-collection-{uuid.uuid4()}")
+
+    name = "test-document.txt"
+    data = b"Hello, world!"
+
+    document_metadata = await client.collections.upload_document(
+        collection_metadata.collection_id, name, io.BytesIO(data)
+    )
+    assert document_metadata.file_metadata.name == name
+    assert document_metadata.file_metadata.size_bytes == len(data)
+
+
 @pytest.mark.asyncio(loop_scope="session")
 async def test_add_existing_document_to_collection(client: AsyncClient):
     # Create a collection to add the document to.
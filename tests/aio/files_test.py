@@ -1,5 +1,6 @@
 """Unit tests for asynchronous Files API client."""
 
+import asyncio
 import datetime
 import io
 import os
@@ -409,6 +410,23 @@ async def test_content(client_with_mock_stub: AsyncClient, mock_stub):
     assert result == b"Hello world!"
 
 
+@pytest.mark.asyncio
+async def test_iter_content(client_with_mock_stub: AsyncClient, mock_stub):
+    """Test iterating over file content chunk by chunk asynchronously."""
+
+    async def async_gen():
+        yield files_pb2.FileContentChunk(data=b"Hello ")
+        yield files_pb2.FileContentChunk(data=b"world!")
+
+    mock_stub.RetrieveFileContent.return_value = async_gen()
+
+    chunks = [chunk async for chunk in client_with_mock_stub.files.iter_content("file-123")]
+
+    call_args = mock_stub.RetrieveFileContent.call_args[0][0]
+    assert call_args.file_id == "file-123"
+    assert chunks == [b"Hello ", b"world!"]
+
+
 def test_chunk_file_from_path():
     """Test file chunking from path."""
     # Create a temporary file with 12 MiB of data to test multiple chunks
@@ -641,6 +659,42 @@ async def test_batch_upload_with_callback(client_with_mock_stub: AsyncClient, mo
             os.unlink(temp_file)
 
 
+@pytest.mark.asyncio
+async def test_batch_upload_with_slow_async_callback(client_with_mock_stub: AsyncClient, mock_stub):
+    """Test that a slow async callback doesn't hold up the remaining uploads."""
+    files = []
+    for i in range(2):
+        file_obj = io.BytesIO(f"content {i}".encode())
+        file_obj.name = f"slow_callback_{i}.txt"
+        files.append(file_obj)
+
+    async def mock_upload(chunks):
+        async for _ in chunks:
+            pass
+        return files_pb2.File(id="file-id", filename="slow_callback.txt", size=100)
+
+    mock_stub.UploadFile.side_effect = mock_upload
+
+    second_callback_done = asyncio.Event()
+    completed = []
+
+    async def on_complete(idx, _file, _result):
+        # With a single slot, the second upload can only run while this callback is waiting if the slot has
+        # already been released.
+        if idx == 0:
+            await second_callback_done.wait()
+        else:
+            second_callback_done.set()
+        completed.append(idx)
+
+    results = await asyncio.wait_for(
+        client_with_mock_stub.files.batch_upload(files, batch_size=1, on_file_complete=on_complete), timeout=5
+    )
+
+    assert len(results) == 2
+    assert completed == [1, 0]
+
+
 @pytest.mark.asyncio
 async def test_batch_upload_with_callback_and_failures(client_with_mock_stub: AsyncClient, mock_stub):
     """Test batch upload callback receives both successes and failures."""
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+import pytest
+
+from xai_sdk import AsyncClient
+from xai_sdk.aio.shared import close_async_client, get_async_client, run, shutdown
+
+from .. import server
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_async_client_returns_same_instance(monkeypatch):
+    monkeypatch.setenv("XAI_API_KEY", server.API_KEY)
+
+    client = await get_async_client()
+    assert isinstance(client, AsyncClient)
+    assert await get_async_client() is client
+    await close_async_client()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_close_async_client_resets_shared_client(monkeypatch):
+    monkeypatch.setenv("XAI_API_KEY", server.API_KEY)
+
+    client = await get_async_client()
+    await close_async_client()
+    assert await get_async_client() is not client
+    await close_async_client()
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_close_async_client_without_client():
+    await close_async_client()
+
+
+def test_run_reuses_event_loop_and_client(monkeypatch):
+    monkeypatch.setenv("XAI_API_KEY", server.API_KEY)
+
+    async def get_loop_and_client():
+        return asyncio.get_running_loop(), await get_async_client()
+
+    first_loop, first_client = run(get_loop_and_client())
+    second_loop, second_client = run(get_loop_and_client())
+    assert first_loop is second_loop
+    assert first_client is second_client
+    shutdown()
+
+
+def test_shutdown_closes_event_loop(monkeypatch):
+    monkeypatch.setenv("XAI_API_KEY", server.API_KEY)
+
+    async def get_loop():
+        await get_async_client()
+        return asyncio.get_running_loop()
+
+    loop = run(get_loop())
+    shutdown()
+    assert loop.is_closed()
+    assert run(get_loop()) is not loop
+    shutdown()
+
+
+def test_shutdown_without_loop():
+    shutdown()
+
+
+def test_get_async_client_warns_about_client_of_closed_loop(monkeypatch):
+    monkeypatch.setenv("XAI_API_KEY", server.API_KEY)
+
+    first_client = asyncio.run(get_async_client())
+    with pytest.warns(RuntimeWarning, match="could not be closed"):
+        second_client = asyncio.run(get_async_client())
+    assert second_client is not first_client
+
+    with pytest.warns(RuntimeWarning, match="could not be closed"):
+        asyncio.run(close_async_client())
+
+
+def test_get_async_client_closes_client_of_loop_in_other_thread(monkeypatch):
+    monkeypatch.setenv("XAI_API_KEY", server.API_KEY)
+
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+    try:
+        first_client = asyncio.run_coroutine_threadsafe(get_async_client(), other_loop).result()
+        closed_on = []
+        close = first_client.close
+
+        async def record_close():
+            closed_on.append(asyncio.get_running_loop())
+            await close()
+
+        monkeypatch.setattr(first_client, "close", record_close)
+
+        async def replace_and_close():
+            client = await get_async_client()
+            await close_async_client()
+            return client
+
+        second_client = asyncio.run(replace_and_close())
+        # The replaced client was closed on its own loop before `get_async_client` returned.
+        assert closed_on == [other_loop]
+        assert second_client is not first_client
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
@@ -1,6 +1,17 @@
-import pytest
+import datetime
+import json
 
-from xai_sdk.chat import CompactContextResponse, Response, _agent_count_to_proto, developer
+import pytest
+from pydantic import BaseModel
+
+from xai_sdk.chat import (
+    CompactContextResponse,
+    Response,
+    _agent_count_to_proto,
+    _deferred_poll_timer,
+    _json_schema_for_model,
+    developer,
+)
 from xai_sdk.proto import chat_pb2, sample_pb2, usage_pb2
 from xai_sdk.tools import get_tool_call_type
 
@@ -270,6 +281,39 @@ def test_get_tool_call_type():
     assert get_tool_call_type(client_side_tool_call) == "client_side_tool"
 
 
+def test_get_tool_call_type_covers_all_types():
+    """Test that get_tool_call_type returns the lowercase name without prefix for every tool call type."""
+    for name, value in chat_pb2.ToolCallType.items():
+        tool_call = chat_pb2.ToolCall(type=value)
+        assert get_tool_call_type(tool_call) == name.removeprefix("TOOL_CALL_TYPE_").lower()
+
+
+def test_deferred_poll_timer_backs_off_by_default():
+    timer = _deferred_poll_timer(datetime.timedelta(minutes=1), None)
+
+    intervals = [timer.sleep_interval_or_raise() for _ in range(10)]
+
+    assert intervals[0] == pytest.approx(0.1)
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == pytest.approx(2)
+
+
+def test_deferred_poll_timer_fixed_interval():
+    timer = _deferred_poll_timer(datetime.timedelta(minutes=1), datetime.timedelta(milliseconds=500))
+
+    assert [timer.sleep_interval_or_raise() for _ in range(3)] == [0.5, 0.5, 0.5]
+
+
+def test_json_schema_for_model_is_cached():
+    class Answer(BaseModel):
+        text: str
+
+    schema = _json_schema_for_model(Answer)
+
+    assert json.loads(schema) == Answer.model_json_schema()
+    assert _json_schema_for_model(Answer) is schema
+
+
 def test_response_debug_output():
     """Test that Response.debug_output returns the debug output from the response proto."""
     # Create a debug output with some test data
@@ -0,0 +1,16 @@
+import datetime
+
+import pytest
+
+from xai_sdk import collections
+
+
+def test_default_indexing_poll_interval_is_deprecated():
+    with pytest.warns(DeprecationWarning, match="DEFAULT_INDEXING_POLL_INTERVAL is deprecated"):
+        interval = collections.DEFAULT_INDEXING_POLL_INTERVAL
+    assert interval == datetime.timedelta(seconds=10)
+
+
+def test_unknown_module_attribute_raises():
+    with pytest.raises(AttributeError):
+        collections.DOES_NOT_EXIST  # noqa: B018
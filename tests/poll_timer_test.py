@@ -0,0 +1,38 @@
+import datetime
+import time
+
+import pytest
+
+from xai_sdk.poll_timer import PollTimer
+
+
+def test_fixed_interval():
+    timer = PollTimer(datetime.timedelta(minutes=1), datetime.timedelta(seconds=2))
+
+    assert timer.sleep_interval_or_raise() == 2
+    assert timer.sleep_interval_or_raise() == 2
+
+
+def test_backoff_interval_is_capped():
+    timer = PollTimer(
+        datetime.timedelta(minutes=1),
+        datetime.timedelta(seconds=1),
+        max_interval=datetime.timedelta(seconds=3),
+        backoff_factor=2.0,
+    )
+
+    assert [timer.sleep_interval_or_raise() for _ in range(4)] == [1, 2, 3, 3]
+
+
+def test_interval_does_not_exceed_remaining_time():
+    timer = PollTimer(datetime.timedelta(seconds=1), datetime.timedelta(seconds=10))
+
+    assert timer.sleep_interval_or_raise() <= 1
+
+
+def test_raises_after_timeout():
+    timer = PollTimer(datetime.timedelta(milliseconds=1), context="waiting for test")
+    time.sleep(0.01)
+
+    with pytest.raises(TimeoutError, match="waiting for test"):
+        timer.sleep_interval_or_raise()
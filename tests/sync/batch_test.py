@@ -284,6 +284,23 @@ def test_list_batch_results_pagination(client: Client):
     assert page3.pagination_token is None  # No more pages
 
 
+def test_stream_batch_results(client: Client):
+    """Test that stream_batch_results yields the results of all pages."""
+    batch = client.batch.create("test_batch")
+
+    batch_requests = []
+    for i in range(5):
+        chat = client.chat.create(model="grok-3-latest", batch_request_id=f"req_{i}")
+        chat.append(user(f"Message {i}"))
+        batch_requests.append(chat)
+
+    client.batch.add(batch.batch_id, batch_requests)
+
+    results = list(client.batch.stream_batch_results(batch.batch_id, limit=2))
+    assert sorted(result.batch_request_id for result in results) == [f"req_{i}" for i in range(5)]
+    assert all(result.is_success for result in results)
+
+
 def test_get_nonexistent_batch(client: Client):
     """Test getting a non-existent batch raises an error."""
     with pytest.raises(grpc.RpcError) as e:
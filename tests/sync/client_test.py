@@ -1,4 +1,5 @@
 import grpc
+import portpicker
 import pytest
 
 from xai_sdk import Client
@@ -26,6 +27,22 @@ def test_client(test_server_port):
     assert api_key.redacted_api_key == "1**"
 
 
+def test_client_connect(test_server_port):
+    client = Client(api_key=server.API_KEY, api_host=f"localhost:{test_server_port}")
+
+    client.connect(timeout=5)
+
+    api_key = client.auth.get_api_key_info()
+    assert api_key.redacted_api_key == "1**"
+
+
+def test_client_connect_timeout():
+    client = Client(api_key=server.API_KEY, api_host=f"localhost:{portpicker.pick_unused_port()}")
+
+    with pytest.raises(TimeoutError):
+        client.connect(timeout=0.1)
+
+
 def test_client_wrong_api_key(test_server_port):
     client = Client(api_key=server.API_KEY + "bad", api_host=f"localhost:{test_server_port}")
 
@@ -1,4 +1,5 @@
 import datetime
+import io
 import uuid
 from typing import Union
 from unittest import mock
@@ -620,6 +621,17 @@ def test_upload_document(client: Client):
     assert response.fields == fields
 
 
+def test_upload_document_from_file_object(client: Client):
+    collection_metadata = client.collections.create(f"test-collection-{uuid.uuid4()}")
+
+    name = "test-document.txt"
+    data = b"Hello, world!"
+
+    document_metadata = client.collections.upload_document(collection_metadata.collection_id, name, io.BytesIO(data))
+    assert document_metadata.file_metadata.name == name
+    assert document_metadata.file_metadata.size_bytes == len(data)
+
+
 def test_upload_document_without_wait_for_indexing(client: Client):
     """Test uploading a document without waiting for indexing returns immediately with PROCESSED status."""
     collection_metadata = client.collections.create(f"test-collection-{uuid.uuid4()}")
@@ -742,6 +754,26 @@ def test_upload_document_with_custom_poll_interval(client: Client):
     assert document_metadata.status == collections_pb2.DocumentStatus.DOCUMENT_STATUS_PROCESSED
 
 
+def test_upload_document_default_poll_interval_backs_off(client: Client):
+    """Test wait_for_indexing without a poll_interval starts with short polls."""
+
+    collection_metadata = client.collections.create(f"test-collection-{uuid.uuid4()}")
+
+    start_time = datetime.datetime.now()
+    document_metadata = client.collections.upload_document(
+        collection_metadata.collection_id,
+        "test-processing-0.5",  # Simulates 0.5 second processing
+        b"Hello, world!",
+        wait_for_indexing=True,
+        timeout=datetime.timedelta(seconds=5),
+    )
+    elapsed = (datetime.datetime.now() - start_time).total_seconds()
+
+    # The first polls are short, so the document is picked up well before the maximum interval of 2 seconds.
+    assert 0.5 <= elapsed < 1.5
+    assert document_metadata.status == collections_pb2.DocumentStatus.DOCUMENT_STATUS_PROCESSED
+
+
 def test_add_existing_document_to_collection(client: Client):
     # Create a collection to add the document to.
     collection_metadata = client.collections.create(f"test-collection-{uuid.uuid4()}")
@@ -403,6 +403,19 @@ def test_content(client_with_mock_stub: Client, mock_stub):
     assert result == b"Hello world!"
 
 
+def test_iter_content(client_with_mock_stub: Client, mock_stub):
+    """Test iterating over file content chunk by chunk."""
+    chunk1 = files_pb2.FileContentChunk(data=b"Hello ")
+    chunk2 = files_pb2.FileContentChunk(data=b"world!")
+    mock_stub.RetrieveFileContent.return_value = [chunk1, chunk2]
+
+    chunks = list(client_with_mock_stub.files.iter_content("file-123"))
+
+    call_args = mock_stub.RetrieveFileContent.call_args[0][0]
+    assert call_args.file_id == "file-123"
+    assert chunks == [b"Hello ", b"world!"]
+
+
 def test_order_conversion():
     """Test order string to protobuf conversion."""
     assert _order_to_pb("asc") == files_pb2.Ordering.ASCENDING
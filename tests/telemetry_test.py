@@ -5,6 +5,7 @@ import pytest
 from opentelemetry import trace as otel_trace
 from opentelemetry.sdk.resources import SERVICE_NAME, SERVICE_VERSION
 from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
 
 from xai_sdk.__about__ import __version__ as xai_sdk_version
 from xai_sdk.telemetry import Telemetry, get_tracer, should_disable_sensitive_attributes
@@ -34,6 +35,25 @@ def test_telemetry_uses_provided_provider():
     assert otel_trace.get_tracer_provider() is not custom_provider
 
 
+def test_setup_console_exporter_exports_synchronously_by_default():
+    provider = TracerProvider()
+    Telemetry(provider=provider).setup_console_exporter()
+
+    processors = provider._active_span_processor._span_processors
+    assert len(processors) == 1
+    assert isinstance(processors[0], SimpleSpanProcessor)
+
+
+def test_setup_console_exporter_batch():
+    provider = TracerProvider()
+    Telemetry(provider=provider).setup_console_exporter(batch=True)
+
+    processors = provider._active_span_processor._span_processors
+    assert len(processors) == 1
+    assert isinstance(processors[0], BatchSpanProcessor)
+    provider.shutdown()
+
+
 def test_get_tracer_returns_tracer_by_default():
     tracer = get_tracer("test-tracer")
     assert isinstance(tracer, otel_trace.Tracer)